@@ -0,0 +1,235 @@
+import argparse
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import tornado.httpserver
+import tornado.ioloop
+import tornado.netutil
+import tornado.process
+import tornado.web
+
+from research.zero_study_research import ZeroStudyResearcher
+from research.collection_registry import load_collections
+from utils.domain_query import DomainQuery
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class SnapshotCache:
+    """Per-collection query indexes and rendered responses, keyed by data version.
+
+    The data version is the collection's last_updated timestamp, re-read
+    from SQLite at most every version_ttl seconds. A new version replaces
+    that collection's index and drops its cached responses, so nothing is
+    ever served from an older snapshot after the next version check.
+    """
+
+    def __init__(self, researcher: ZeroStudyResearcher, version_ttl: float = 2.0,
+                 max_responses: int = 20000):
+        self.researcher = researcher
+        self.version_ttl = version_ttl
+        self.max_responses = max_responses
+        self._versions: Dict[str, str] = {}
+        self._versions_checked = 0.0
+        self._queries: Dict[str, Tuple[str, DomainQuery]] = {}
+        self._responses: 'OrderedDict[Tuple[str, str, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def versions(self) -> Dict[str, str]:
+        now = time.monotonic()
+        if now - self._versions_checked > self.version_ttl:
+            self._versions = self.researcher.get_collection_versions()
+            self._versions_checked = now
+        return self._versions
+
+    def query(self, key: str, version: str) -> DomainQuery:
+        """DomainQuery for a collection at the given version, rebuilt on change"""
+        with self._lock:
+            cached = self._queries.get(key)
+            if cached is None or cached[0] != version:
+                started = time.perf_counter()
+                query = DomainQuery(self.researcher.load_collection_frame(key))
+                self._queries[key] = (version, query)
+                for cache_key in [k for k in self._responses if k[0] == key]:
+                    del self._responses[cache_key]
+                logger.info(f"Indexed {len(query)} domains for {key} at {version} "
+                            f"in {time.perf_counter() - started:.2f}s")
+            return self._queries[key][1]
+
+    def response(self, cache_key: Tuple[str, str, str], render: Callable[[], Any]) -> bytes:
+        """Serialized response body, rendered once per (collection, version, uri)"""
+        body = self._responses.get(cache_key)
+        if body is not None:
+            self._responses.move_to_end(cache_key)
+            return body
+
+        body = json.dumps(render(), default=str).encode('utf-8')
+        self._responses[cache_key] = body
+        if len(self._responses) > self.max_responses:
+            self._responses.popitem(last=False)
+        return body
+
+
+class ApiHandler(tornado.web.RequestHandler):
+    """Shared plumbing: collection selection, ETags and the response cache"""
+
+    def initialize(self, cache: SnapshotCache, default_collection: str):
+        self.cache = cache
+        self.default_collection = default_collection
+
+    def set_default_headers(self):
+        self.set_header('Content-Type', 'application/json; charset=utf-8')
+        self.set_header('Cache-Control', 'public, max-age=60')
+
+    def write_error(self, status_code: int, **kwargs):
+        # Errors depend on the request, not only the snapshot, so shared caches must not keep them
+        self.set_header('Cache-Control', 'no-store')
+        self.finish(json.dumps({'error': self._reason}))
+
+    def page_args(self) -> Tuple[Optional[str], int]:
+        after = self.get_query_argument('after', None)
+        try:
+            limit = int(self.get_query_argument('limit', str(DEFAULT_PAGE_SIZE)))
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="limit must be an integer")
+        return after, max(1, min(limit, MAX_PAGE_SIZE))
+
+    def serve(self, render: Callable[[DomainQuery], Any]) -> None:
+        key = self.get_query_argument('collection', self.default_collection).lower()
+        version = self.cache.versions().get(key)
+        if version is None:
+            raise tornado.web.HTTPError(404, reason=f"No data for collection {key}")
+
+        # Same version and URI always produce the same body, so the ETag needs no rendering
+        digest = hashlib.blake2b(f"{key}|{version}|{self.request.uri}".encode('utf-8'), digest_size=12)
+        self.set_header('Etag', f'"{digest.hexdigest()}"')
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        def render_payload():
+            payload = render(self.cache.query(key, version))
+            if payload is None:
+                return None
+            return {'collection': key, 'version': version, **payload}
+
+        body = self.cache.response((key, version, self.request.uri), render_payload)
+        if body == b'null':
+            self.clear_header('Etag')
+            raise tornado.web.HTTPError(404, reason="Not found")
+        self.write(body)
+
+
+class HealthHandler(ApiHandler):
+    def get(self):
+        self.set_header('Cache-Control', 'no-cache')
+        self.write(json.dumps({'status': 'ok', 'collections': self.cache.versions()}))
+
+
+class DomainHandler(ApiHandler):
+    def get(self, name: str):
+        def render(query):
+            record = query.get_domain(name)
+            return {'data': record} if record else None
+        self.serve(render)
+
+
+class WorldSubtreeHandler(ApiHandler):
+    def get(self, world: str):
+        after, limit = self.page_args()
+
+        def render(query):
+            records, next_cursor = query.world_subtree(world, after, limit)
+            return {'data': records, 'next': next_cursor} if records or after else None
+        self.serve(render)
+
+
+class OwnerHandler(ApiHandler):
+    def get(self, owner: str):
+        after, limit = self.page_args()
+
+        def render(query):
+            summary, records, next_cursor = query.owner_holdings(owner, after, limit)
+            if summary is None:
+                return None
+            return {'owner': summary, 'data': records, 'next': next_cursor}
+        self.serve(render)
+
+
+class SearchHandler(ApiHandler):
+    def get(self):
+        term = self.get_query_argument('q', '').strip()
+        if not term:
+            raise tornado.web.HTTPError(400, reason="q is required")
+        after, limit = self.page_args()
+
+        def render(query):
+            records, next_cursor = query.search(term, after, limit)
+            return {'data': records, 'next': next_cursor}
+        self.serve(render)
+
+
+class TopHandler(ApiHandler):
+    def get(self, kind: str):
+        try:
+            n = max(1, min(int(self.get_query_argument('n', '25')), MAX_PAGE_SIZE))
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="n must be an integer")
+
+        def render(query):
+            records = query.top_domains(n) if kind == 'domains' else query.top_owners(n)
+            return {'data': records}
+        self.serve(render)
+
+
+def make_app(researcher: ZeroStudyResearcher) -> tornado.web.Application:
+    collections = load_collections()
+    handler_args = {
+        'cache': SnapshotCache(researcher),
+        'default_collection': collections[0]['key'],
+    }
+    return tornado.web.Application([
+        (r"/v1/health", HealthHandler, handler_args),
+        (r"/v1/domains/(.+)", DomainHandler, handler_args),
+        (r"/v1/worlds/([^/]+)/subtree", WorldSubtreeHandler, handler_args),
+        (r"/v1/owners/(0x[0-9a-fA-F]{40})", OwnerHandler, handler_args),
+        (r"/v1/search", SearchHandler, handler_args),
+        (r"/v1/top/(domains|owners)", TopHandler, handler_args),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the Zero domain store")
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--db', default="data/reservoir_data.db")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="worker processes sharing the port (0 = one per CPU)")
+    args = parser.parse_args()
+
+    sockets = tornado.netutil.bind_sockets(args.port)
+    if args.processes != 1:
+        # Each worker keeps its own index and response cache
+        tornado.process.fork_processes(args.processes)
+
+    # The API only reads: no API key, no migrations and no writes to the database
+    researcher = ZeroStudyResearcher.open_read_only(db_file=args.db)
+    if not researcher.get_collection_versions():
+        logger.warning(f"No collection data in {args.db}; run the app or scripts/fetch_data.py to create or upgrade it")
+    app = make_app(researcher)
+    server = tornado.httpserver.HTTPServer(app)
+    server.add_sockets(sockets)
+    logger.info(f"Serving API on port {args.port}")
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
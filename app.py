@@ -3,10 +3,21 @@ import pandas as pd
 import os
 from datetime import datetime, timedelta
 from research.zero_study_research import ZeroStudyResearcher
+from research.refresh_worker import RefreshWorker, BOOTSTRAP_MESSAGE
+from research.collection_registry import load_collections
+from research.snapshot_importer import SnapshotImporter
 from utils.visualization import Visualizer
 from utils.export import DataExporter
+from utils.owner_index import OwnerIndex
+from utils.profiling import profiler
+from utils.figure_cache import (FigureCache, growth_candidates,
+                                DEFAULT_MIN_MEMBERS, DEFAULT_GROWTH_DOMAINS)
+from utils.shared_cache import SharedCache, SHARED_CACHE_FILE
+from utils.graph_analytics import ANALYTICS_COLUMNS
+import numpy as np
 import zipfile
 import io
+import time
 
 # Page config with responsive layout
 st.set_page_config(
@@ -64,6 +75,8 @@ This tool visualizes the Zero domain ecosystem, showing relationships between
 worlds, domains, and their owners.
 """)
 
+rerun_start = time.perf_counter()
+
 try:
     # Initialize researcher if not in session state
     if 'researcher' not in st.session_state:
@@ -72,8 +85,24 @@ try:
     # Add refresh button and search box in sidebar
     st.sidebar.header("Controls")
 
-    # Get current data and last refresh time
-    data, last_refresh = st.session_state.researcher.load_saved_data()
+    # Pick which tracked collections to combine (only shown when there is a choice)
+    collections = load_collections()
+    labels = {entry['key']: entry['label'] for entry in collections}
+    if len(collections) > 1:
+        selected_collections = st.sidebar.multiselect(
+            "Collections",
+            options=list(labels),
+            default=list(labels),
+            format_func=lambda key: labels[key])
+    else:
+        selected_collections = list(labels)
+
+    # Get current data and last refresh time (memory-mapped Arrow snapshot, shared across workers)
+    with profiler.phase('app.load_saved_data'):
+        saved_df, last_refresh = st.session_state.researcher.load_saved_frame(selected_collections or None)
+
+    refresh_worker = RefreshWorker(st.session_state.researcher)
+    refresh_running = refresh_worker.is_running()
 
     # Check if refresh is allowed (more than 24 hours since last refresh)
     now = datetime.now()
@@ -81,7 +110,9 @@ try:
     refresh_allowed = time_since_refresh > timedelta(days=1)
 
     # Create refresh button with dynamic state
-    if not refresh_allowed:
+    if refresh_running:
+        refresh = st.sidebar.button("🔄 Refresh Data", disabled=True)
+    elif not refresh_allowed:
         hours_until_refresh = 24 - (time_since_refresh.total_seconds() / 3600)
         st.sidebar.warning(
             f"Refresh available in {int(hours_until_refresh)} hours")
@@ -89,6 +120,32 @@ try:
     else:
         refresh = st.sidebar.button("🔄 Refresh Data")
 
+    # The crawl runs in a separate process; this session keeps serving the current snapshot
+    if refresh and refresh_allowed:
+        if refresh_worker.launch():
+            st.sidebar.success("Refresh started in the background")
+        else:
+            st.sidebar.info("A refresh is already running")
+
+    @st.fragment(run_every="10s")
+    def refresh_status_panel():
+        """Poll the background refresh and reload once a new snapshot lands"""
+        status = refresh_worker.get_status()
+        if status['refresh_status'] == 'running' and status['refresh_message'] == BOOTSTRAP_MESSAGE:
+            st.info("Loading the bundled snapshot in the background")
+        elif status['refresh_status'] == 'running':
+            st.info(f"Refreshing in the background: {status['refresh_progress'] or 0} tokens fetched")
+        elif status['refresh_status'] == 'failed':
+            st.error(f"Last refresh failed: {status['refresh_message']}")
+        elif status['refresh_status'] == 'stale':
+            st.warning("Last refresh stopped responding and can be restarted.")
+
+        if st.session_state.researcher.get_last_updated() != last_refresh:
+            st.rerun()
+
+    with st.sidebar:
+        refresh_status_panel()
+
     # Show last refresh time
     st.sidebar.caption(
         f"Last Refreshed: {last_refresh.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -104,53 +161,60 @@ try:
                                          ["CSV", "JSON", "Excel"])
 
     # Add compression option for large datasets
-    if data is not None and len(data) > 1000:
+    if len(saved_df) > 1000:
         st.sidebar.info("Large dataset detected - compression recommended")
         use_compression = st.sidebar.checkbox("Compress export file",
                                               value=True)
     else:
         use_compression = False
 
-    # Fetch data with loading indicator
-    with st.spinner("Loading domain data..." if not refresh else
-                    "Fetching fresh data from Reservoir..."):
-        if refresh and refresh_allowed:
-            try:
-                data, last_refresh = st.session_state.researcher.get_nft_data(
-                    force_refresh=True)
-                if not data:
-                    st.error(
-                        "No domain data available. This could be due to API rate limits or an invalid API key."
-                    )
-                    st.info(
-                        "Please wait a few minutes and try again, or check your Reservoir API key."
-                    )
-                    st.stop()
-            except Exception as e:
-                st.error(f"Error fetching data: {str(e)}")
-                st.info(
-                    "Please check your Reservoir API key or try again later.")
-                st.stop()
-
-    # Convert to DataFrame and validate data
-    try:
-        df = pd.DataFrame(data)
-    except Exception as e:
-        st.error(f"Error processing domain data: {str(e)}")
+    # A fresh deployment imports the bundled exports in the background instead of waiting for a
+    # crawl; the outcome is recorded, so a broken export is not retried on every page load
+    if (saved_df.empty and not refresh_running and refresh_worker.bootstrap_status() is None
+            and SnapshotImporter(st.session_state.researcher).bootstrap_paths()):
+        refresh_running = refresh_worker.launch(bootstrap=True)
+
+    if saved_df.empty:
+        if refresh_running:
+            st.info("Loading domain data in the background. This page reloads when it is ready.")
+        else:
+            st.warning("No domain data available yet. Start a refresh to fetch it from Reservoir.")
         st.stop()
 
-    # Apply search filter if term is provided
-    if search_term:
+    df = saved_df
+
+    # Derived results live in one SQLite cache shared by every server process, keyed by the
+    # data version; the refresh worker drops entries from older versions when it lands new data
+    if 'shared_cache' not in st.session_state:
+        st.session_state.shared_cache = SharedCache(
+            os.path.join(os.path.dirname(st.session_state.researcher.db_file), SHARED_CACHE_FILE))
+    shared_cache = st.session_state.shared_cache
+    figure_cache = FigureCache(shared_cache)
+    data_version = last_refresh.isoformat()
+    collections_key = SharedCache.make_key(selected_collections)
+
+    def search_positions():
         mask = (df['name'].str.contains(search_term, case=False, na=False)
                 | df['world'].str.contains(search_term, case=False, na=False)
                 | df['domain'].str.contains(search_term, case=False, na=False))
-        df = df[mask]
-
-    # Calculate metrics
-    total_domains = len(df)
-    total_worlds = df['world'].nunique()
-    domains_with_members = len(df[df['member_count'] > 0])
-    total_subdomains = len(df[df['is_subdomain'] == True])
+        return np.flatnonzero(mask.to_numpy())
+
+    with profiler.phase('app.search_filter'):
+        # Apply search filter if term is provided
+        if search_term:
+            # The term is a case-insensitive regex, so lowercasing the key would merge
+            # different patterns such as \D and \d
+            positions = shared_cache.get_or_compute(
+                'search', SharedCache.make_key(selected_collections, search_term),
+                data_version, search_positions)
+            df = df.iloc[positions]
+
+    with profiler.phase('app.metrics'):
+        # Calculate metrics
+        total_domains = len(df)
+        total_worlds = df['world'].nunique()
+        domains_with_members = len(df[df['member_count'] > 0])
+        total_subdomains = len(df[df['is_subdomain'] == True])
 
     # Display metrics in responsive columns
     col1, col2 = st.columns(2)
@@ -169,37 +233,182 @@ try:
 
     # Add view toggle with Visualize as default
     view_mode = st.radio("View Mode",
-                         ["Visualize", "Member Growth", "Details"],
+                         ["Visualize", "Member Growth", "Rankings", "Top Holders", "World Overlap", "Changes",
+                          "Details"],
                          horizontal=True)
 
+    view_start = time.perf_counter()
     if view_mode == "Visualize":
         # Display network visualization
         st.subheader("Domain Network Visualization")
         min_members = st.slider("Show domains with more than X members",
                                 min_value=1,
                                 max_value=50,
-                                value=20)
-        fig = Visualizer.create_network_graph(df, min_members=min_members)
+                                value=DEFAULT_MIN_MEMBERS)
+        fig = figure_cache.get_or_build(
+            data_version, 'network_graph',
+            {'collections': selected_collections, 'min_members': min_members, 'search': search_term},
+            lambda: Visualizer.create_network_graph(df, min_members=min_members))
         st.plotly_chart(fig, use_container_width=True)
     elif view_mode == "Member Growth":
         st.subheader("Domain Member Growth Over Time")
 
         # Get top domains by member count
-        top_domains = df.nlargest(10, 'member_count')
+        top_domains = growth_candidates(df)
 
         # Allow user to select domains to compare
         selected_domains = st.multiselect(
             "Select domains to compare",
-            options=top_domains['name'].tolist(),
-            default=top_domains['name'].head(5).tolist(),
+            options=top_domains,
+            default=top_domains[:DEFAULT_GROWTH_DOMAINS],
             help="Choose up to 5 domains to compare their member growth")
 
         if selected_domains:
-            fig = Visualizer.create_member_growth_chart(df, selected_domains)
+            fig = figure_cache.get_or_build(
+                data_version, 'member_growth',
+                {'collections': selected_collections, 'domains': selected_domains, 'search': search_term},
+                lambda: Visualizer.create_member_growth_chart(df.copy(), selected_domains))
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning(
                 "Please select at least one domain to view its growth trend.")
+    elif view_mode == "Rankings":
+        st.subheader("Domain Rankings")
+        st.caption("Graph metrics computed at refresh time. Components link names through "
+                   "parent/child relationships and shared owners; influence is a PageRank "
+                   "score where 1.0 is the average name.")
+
+        ranking_metrics = {"Influence": 'influence', "Subtree size": 'subtree_size',
+                           "Members": 'member_count', "Component size": 'component_size'}
+        if any(column not in df for column in ANALYTICS_COLUMNS):
+            metrics = None
+        else:
+            # Collections without metrics yet leave nulls that make the combined columns object dtype
+            metrics = df.assign(**{column: pd.to_numeric(df[column], errors='coerce')
+                                   for column in [*ANALYTICS_COLUMNS, 'member_count']})
+        if metrics is None or metrics['influence'].isna().all():
+            st.info("Rankings will be available after the next refresh.")
+        else:
+            rank_col1, rank_col2, rank_col3 = st.columns(3)
+            with rank_col1:
+                rank_by = st.selectbox("Rank by", list(ranking_metrics))
+            with rank_col2:
+                rank_n = st.slider("Domains to show", min_value=10, max_value=500, value=50)
+            with rank_col3:
+                min_component = st.number_input("Minimum component size", min_value=1, value=1)
+
+            # Only names with metrics are ranked
+            ranked = (metrics[metrics['influence'].notna() & (metrics['component_size'] >= min_component)]
+                      .nlargest(rank_n, ranking_metrics[rank_by]))
+            st.dataframe(ranked[['name', 'owner', 'member_count', 'subtree_size', 'influence',
+                                 'owner_component', 'component_size']],
+                         use_container_width=True,
+                         hide_index=True)
+    elif view_mode == "Top Holders":
+        st.subheader("Top Holders")
+
+        # Reuse the owner index built at refresh time unless a search narrows the data
+        if search_term:
+            owner_index = OwnerIndex.from_frame(df)
+        else:
+            owner_index = shared_cache.get_or_compute(
+                'owner_index', collections_key, data_version,
+                lambda: st.session_state.researcher.load_owner_index(selected_collections or None))
+
+        top_n = st.slider("Number of holders to show",
+                          min_value=10,
+                          max_value=200,
+                          value=25)
+        top_holders = owner_index.top_holders(top_n)
+
+        if top_holders.empty:
+            st.info("No owner data available.")
+        else:
+            st.caption(f"{len(owner_index)} unique owners")
+            st.dataframe(top_holders, use_container_width=True, hide_index=True)
+
+            # Drill down into a single holder
+            selected_owner = st.selectbox(
+                "Inspect holder",
+                options=top_holders['owner'].tolist(),
+                help="Pick an address from the list above")
+            lookup = st.text_input("Or look up any address", "").strip()
+            if lookup:
+                selected_owner = lookup
+
+            summary = owner_index.get_summary(selected_owner)
+            if summary is None:
+                st.warning(f"No domains found for `{selected_owner}`")
+            else:
+                owner_col1, owner_col2, owner_col3 = st.columns(3)
+                with owner_col1:
+                    st.metric("Domains Held", summary['domain_count'])
+                with owner_col2:
+                    st.metric("First Mint", str(summary['first_mint'])[:10])
+                with owner_col3:
+                    st.metric("Latest Mint", str(summary['last_mint'])[:10])
+
+                holder_df = df[df['name'].isin(owner_index.get_domains(selected_owner))]
+                st.dataframe(holder_df.sort_values('member_count', ascending=False),
+                             use_container_width=True,
+                             hide_index=True)
+    elif view_mode == "World Overlap":
+        st.subheader("World Overlap")
+        st.caption("Members are the distinct addresses owning names in a world. "
+                   "Overlaps are MinHash estimates built at refresh time.")
+
+        world_sketches = shared_cache.get_or_compute(
+            'world_sketches', collections_key, data_version,
+            lambda: st.session_state.researcher.load_world_sketches(selected_collections or None))
+
+        overlap_col1, overlap_col2 = st.columns(2)
+        with overlap_col1:
+            # A slider needs a range, so small collections just compare every world
+            if len(world_sketches) <= 5:
+                top_worlds = len(world_sketches)
+                st.caption(f"Comparing all {top_worlds} worlds.")
+            else:
+                top_worlds = st.slider("Worlds to compare",
+                                       min_value=5,
+                                       max_value=min(500, len(world_sketches)),
+                                       value=min(30, len(world_sketches)))
+        with overlap_col2:
+            overlap_metric = st.radio("Measure", ["Shared members", "Jaccard similarity"], horizontal=True)
+
+        overlap_key = 'jaccard' if overlap_metric == "Jaccard similarity" else 'overlap'
+        fig = figure_cache.get_or_build(
+            data_version, 'world_overlap',
+            {'collections': selected_collections, 'top': top_worlds, 'metric': overlap_key},
+            lambda: Visualizer.create_world_overlap_heatmap(world_sketches.top(top_worlds), metric=overlap_key))
+        st.plotly_chart(fig, use_container_width=True)
+    elif view_mode == "Changes":
+        st.subheader("Changes Since Last Refresh")
+
+        changes = st.session_state.researcher.load_changes(selected_collections or None)
+        if changes.empty:
+            st.info("No changes recorded for the latest refresh.")
+        else:
+            st.caption(f"Refresh at {changes['refreshed_at'].iloc[0][:19].replace('T', ' ')}")
+
+            change_counts = changes['change_type'].value_counts()
+            change_cols = st.columns(4)
+            for change_col, (change_type, label) in zip(change_cols, [
+                    ("added", "New Mints"), ("removed", "Removed"),
+                    ("transferred", "Transfers"), ("member_changed", "Member Changes")]):
+                with change_col:
+                    st.metric(label, int(change_counts.get(change_type, 0)))
+
+            selected_types = st.multiselect(
+                "Change types",
+                options=sorted(change_counts.index.tolist()),
+                default=sorted(change_counts.index.tolist()))
+            changes = changes[changes['change_type'].isin(selected_types)]
+            if search_term:
+                changes = changes[changes['name'].str.contains(search_term, case=False, na=False)]
+
+            st.dataframe(changes.drop(columns=['id', 'refreshed_at']),
+                         use_container_width=True,
+                         hide_index=True)
     else:
         # Display domain details
         st.subheader("Domain Details")
@@ -236,8 +445,9 @@ try:
                             # Show domains in a more compact format
                             for _, row in root_df.iterrows():
                                 with st.container():
-                                    owner_text = f"`{row['owner']}`" if row[
-                                        'owner'] != "Unknown" else "Unknown"
+                                    owner_text = (f"`{row['owner']}`"
+                                                  if pd.notna(row['owner']) and row['owner'] != "Unknown"
+                                                  else "Unknown")
                                     if row['is_subdomain']:
                                         st.markdown(f"""
                                         - **{row['domain']}** ({row['name']})
@@ -250,6 +460,38 @@ try:
                                         - Members: {row['member_count']}
                                         """)
 
+    if profiler.enabled:
+        profiler.record(f'app.view.{view_mode}', time.perf_counter() - view_start)
+
+    with st.expander("📈 Crawl Telemetry", expanded=False):
+        crawl_runs = st.session_state.researcher.load_crawl_runs()
+        if not crawl_runs:
+            st.info("No crawl telemetry recorded yet.")
+        else:
+            latest_run = crawl_runs[0]
+            run_col1, run_col2, run_col3, run_col4, run_col5 = st.columns(5)
+            with run_col1:
+                st.metric("Pages Fetched", latest_run['pages_fetched'])
+            with run_col2:
+                st.metric("Tokens / sec", f"{latest_run['tokens_per_second']:.2f}")
+            with run_col3:
+                st.metric("429 Responses", latest_run['rate_limit_hits'])
+            with run_col4:
+                st.metric("Backoff", f"{latest_run['backoff_seconds'] / 60:.1f} min",
+                          help="Waiting out 429 penalties and request errors")
+            with run_col5:
+                # Runs recorded before pacing was tracked separately have no value
+                st.metric("Pacing", f"{(latest_run['pacing_seconds'] or 0) / 60:.1f} min",
+                          help="Routine waits for a request slot")
+
+            st.caption(
+                f"Last run {latest_run['status']} at {str(latest_run['started_at'])[:19].replace('T', ' ')}: "
+                f"{latest_run['bytes_received'] / (1024 * 1024):.1f} MB received, "
+                f"parse {latest_run['parse_seconds']:.2f}s, DB write {latest_run['db_write_seconds']:.2f}s")
+            st.dataframe(pd.DataFrame(crawl_runs).drop(columns=['id']),
+                         use_container_width=True,
+                         hide_index=True)
+
     # Show raw data option with horizontal scroll on mobile
     if st.checkbox("Show Raw Data"):
         st.markdown("""
@@ -277,41 +519,50 @@ try:
             min_members=min_members if view_mode == "Visualize" else None,
             compression=compression)
 
-        if export_format == "CSV":
-            csv_buffer = io.StringIO()
-            df.to_csv(csv_buffer, index=False)
-            export_data = csv_buffer.getvalue()
-            mime = "text/csv"
-            if compression:
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w') as zf:
-                    zf.writestr(filename, export_data)
-                export_data = zip_buffer.getvalue()
-                mime = "application/zip"
-
-        elif export_format == "JSON":
-            json_buffer = io.StringIO()
-            df.to_json(json_buffer, orient='records')
-            export_data = json_buffer.getvalue()
-            mime = "application/json"
-            if compression:
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w') as zf:
-                    zf.writestr(filename, export_data)
-                export_data = zip_buffer.getvalue()
-                mime = "application/zip"
-
-        else:  # Excel
-            excel_buffer = io.BytesIO()
-            df.to_excel(excel_buffer, index=False, engine='openpyxl')
-            export_data = excel_buffer.getvalue()
-            mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            if compression:
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w') as zf:
-                    zf.writestr(filename, export_data)
-                export_data = zip_buffer.getvalue()
-                mime = "application/zip"
+        def build_export():
+            if export_format == "CSV":
+                csv_buffer = io.StringIO()
+                df.to_csv(csv_buffer, index=False)
+                export_data = csv_buffer.getvalue()
+                mime = "text/csv"
+                if compression:
+                    zip_buffer = io.BytesIO()
+                    with zipfile.ZipFile(zip_buffer, 'w') as zf:
+                        zf.writestr(filename, export_data)
+                    export_data = zip_buffer.getvalue()
+                    mime = "application/zip"
+
+            elif export_format == "JSON":
+                json_buffer = io.StringIO()
+                df.to_json(json_buffer, orient='records')
+                export_data = json_buffer.getvalue()
+                mime = "application/json"
+                if compression:
+                    zip_buffer = io.BytesIO()
+                    with zipfile.ZipFile(zip_buffer, 'w') as zf:
+                        zf.writestr(filename, export_data)
+                    export_data = zip_buffer.getvalue()
+                    mime = "application/zip"
+
+            else:  # Excel
+                excel_buffer = io.BytesIO()
+                df.to_excel(excel_buffer, index=False, engine='openpyxl')
+                export_data = excel_buffer.getvalue()
+                mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                if compression:
+                    zip_buffer = io.BytesIO()
+                    with zipfile.ZipFile(zip_buffer, 'w') as zf:
+                        zf.writestr(filename, export_data)
+                    export_data = zip_buffer.getvalue()
+                    mime = "application/zip"
+            return export_data, mime
+
+        with profiler.phase('app.export_payload'):
+            export_data, mime = shared_cache.get_or_compute(
+                'export',
+                SharedCache.make_key(selected_collections, search_term, export_format, compression,
+                                     min_members if view_mode == "Visualize" else None),
+                data_version, build_export)
 
         st.sidebar.download_button(
             label=f"📥 Download {export_format}" +
@@ -322,6 +573,19 @@ try:
             help=f"Download the current data as {export_format}" +
             (" (ZIP compressed)" if compression else ""))
 
+    if profiler.enabled:
+        profiler.record('app.rerun', time.perf_counter() - rerun_start)
+
+        # Hidden diagnostics panel, opened with ?diagnostics=1
+        if st.query_params.get('diagnostics'):
+            with st.expander("🩺 Diagnostics", expanded=True):
+                st.caption("Rolling timings for this server process")
+                st.dataframe(pd.DataFrame(profiler.summary()),
+                             use_container_width=True,
+                             hide_index=True)
+                if st.button("Reset timings"):
+                    profiler.reset()
+
 except Exception as e:
     st.error(f"An error occurred: {str(e)}")
     st.write("Please check the logs for more details.")
@@ -0,0 +1,203 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+# The researcher insists on an API key; benchmarks never hit the network
+os.environ.setdefault('RESERVOIR_API_KEY', 'benchmark')
+
+from benchmarks.synthetic import SyntheticRegistry
+from research.zero_study_research import ZeroStudyResearcher
+from utils.visualization import Visualizer
+from utils.export import DataExporter
+from utils.data_processor import DataProcessor
+from utils.graph_analytics import DomainGraph
+
+# Keep the pipeline's INFO logging out of the timings
+logging.getLogger().setLevel(logging.WARNING)
+
+DEFAULT_SIZES = [10_000, 100_000]
+DEFAULT_REPEATS = 3
+SEARCH_TERM = 'bank'
+
+
+def search_filter(df, search_term):
+    """Same mask app.py applies for the sidebar search"""
+    mask = (df['name'].str.contains(search_term, case=False, na=False)
+            | df['world'].str.contains(search_term, case=False, na=False)
+            | df['domain'].str.contains(search_term, case=False, na=False))
+    return df[mask]
+
+
+def measure(func, repeats=DEFAULT_REPEATS):
+    """Time func and trace its memory, returning (result, median seconds, peak traced MB).
+
+    tracemalloc slows allocation-heavy code several times over, so the
+    timed runs (after one warm-up) are untraced and peak memory comes
+    from a separate traced run.
+    """
+    result = func()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, statistics.median(timings), peak / (1024 * 1024)
+
+
+def build_scenarios(researcher, registry):
+    """Ordered (name, callable) pairs; later scenarios reuse earlier results"""
+    state = {}
+
+    def parse_tokens():
+        state['domains'] = researcher.process_tokens(registry.tokens)
+        return len(state['domains'])
+
+    def save_data():
+        researcher.save_data(state['domains'])
+        return len(state['domains'])
+
+    def load_saved_data():
+        data, _ = researcher.load_saved_data()
+        state['df'] = pd.DataFrame(data)
+        return len(data)
+
+    def load_saved_frame():
+        df, _ = researcher.load_saved_frame()
+        return len(df)
+
+    def search():
+        return len(search_filter(state['df'], SEARCH_TERM))
+
+    def network_graph():
+        fig = Visualizer.create_network_graph(state['df'], min_members=20)
+        return len(fig.data)
+
+    def member_growth_chart():
+        fig = Visualizer.create_member_growth_chart(state['df'].copy())
+        return len(fig.data)
+
+    def processor_positions():
+        df = state['df']
+        positions = DataProcessor.compute_positions(df['name'].str.slice(4).tolist(),
+                                                    df['member_count'].to_numpy())
+        return len(positions['x'])
+
+    def graph_analytics():
+        return len(DomainGraph.annotate(pd.DataFrame(state['domains'])))
+
+    def export(method):
+        return lambda: len(method(state['df']))
+
+    return [
+        ('parse_tokens', parse_tokens),
+        ('graph_analytics', graph_analytics),
+        ('save_data', save_data),
+        ('load_saved_data', load_saved_data),
+        ('load_saved_frame', load_saved_frame),
+        ('search_filter', search),
+        ('processor_positions', processor_positions),
+        ('create_network_graph', network_graph),
+        ('create_member_growth_chart', member_growth_chart),
+        ('export_csv', export(DataExporter.to_csv)),
+        ('export_json', export(DataExporter.to_json)),
+        ('export_excel', export(DataExporter.to_excel)),
+        ('export_csv_zip', export(lambda df: DataExporter.to_csv(df, compression='zip'))),
+    ]
+
+
+def run(sizes, only=None, seed=7, repeats=DEFAULT_REPEATS):
+    results = []
+    for size in sizes:
+        print(f"Generating synthetic registry with {size} names", file=sys.stderr)
+        registry = SyntheticRegistry(size, seed=seed)
+        registry.tokens  # generate up front so it is not timed
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            researcher = ZeroStudyResearcher(db_file=os.path.join(tmp_dir, 'bench.db'))
+            for name, scenario in build_scenarios(researcher, registry):
+                # Dependencies of a skipped scenario still run, untimed in the output
+                selected = only is None or name in only
+                if not selected:
+                    if name in ('parse_tokens', 'load_saved_data', 'save_data'):
+                        scenario()
+                    continue
+                output, seconds, peak_mb = measure(scenario, repeats)
+                results.append({
+                    'scenario': name,
+                    'size': size,
+                    'seconds': round(seconds, 4),
+                    'peak_mb': round(peak_mb, 2),
+                    'output': output
+                })
+                print(f"{name:<28} n={size:<9} {seconds:9.3f}s {peak_mb:9.1f} MB", file=sys.stderr)
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'seed': seed,
+        'repeats': repeats,
+        'results': results
+    }
+
+
+def compare(current, previous_path):
+    """Print per-scenario time ratios against a previous results file"""
+    with open(previous_path) as f:
+        previous = json.load(f)
+    baseline = {(r['scenario'], r['size']): r for r in previous['results']}
+    for r in current['results']:
+        old = baseline.get((r['scenario'], r['size']))
+        if old and old['seconds'] > 0:
+            ratio = r['seconds'] / old['seconds']
+            flag = '  REGRESSION' if ratio > 1.2 else ''
+            print(f"{r['scenario']:<28} n={r['size']:<9} {old['seconds']:9.3f}s -> {r['seconds']:9.3f}s ({ratio:5.2f}x){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Zero domain pipeline on synthetic data")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="registry sizes to generate (e.g. 10000 100000 1000000)")
+    parser.add_argument('--scenarios', nargs='+', default=None,
+                        help="only run these scenarios")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS,
+                        help="untraced timed runs per scenario after one warm-up; the median is reported")
+    parser.add_argument('--output', default='bench_results.json',
+                        help="where to write the JSON results")
+    parser.add_argument('--compare', default=None, metavar='PREVIOUS_JSON',
+                        help="print time ratios against an earlier results file")
+    args = parser.parse_args()
+
+    results = run(args.sizes, only=set(args.scenarios) if args.scenarios else None,
+                  seed=args.seed, repeats=args.repeats)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results['results'])} results to {args.output}", file=sys.stderr)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
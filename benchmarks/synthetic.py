@@ -0,0 +1,90 @@
+import numpy as np
+from typing import List, Dict, Any, Iterator
+from datetime import datetime, timedelta
+
+CONTRACT_ADDRESS = '0xc14ea65f0a478c649b7a037bc0ad0a765b49196b'
+
+LABEL_WORDS = ['zero', 'world', 'bank', 'free', 'dao', 'art', 'music', 'club', 'labs',
+               'city', 'guild', 'meta', 'node', 'hub', 'pay', 'name', 'home', 'game']
+
+
+class SyntheticRegistry:
+    """Deterministic synthetic ZNS registry shaped like the real collection.
+
+    Worlds are roughly 4% of names. Every other name hangs off an earlier
+    name, chosen with a strong bias toward the oldest ones, which gives a
+    few very large worlds, a long tail of small ones and subdomain chains
+    up to max_depth levels deep. Owners follow a power law so a handful of
+    addresses hold far more names than the rest.
+    """
+
+    def __init__(self, size: int, seed: int = 7, max_depth: int = 6):
+        self.size = size
+        self.seed = seed
+        self.max_depth = max_depth
+        self._tokens = None
+
+    def _generate(self) -> List[Dict[str, Any]]:
+        rng = np.random.default_rng(self.seed)
+        n = self.size
+        n_worlds = max(1, n // 25)
+        n_owners = max(1, n // 4)
+
+        # Parent choice: cubing a uniform draw skews toward early (older) names
+        parent_draws = (rng.random(n) ** 3 * np.arange(n)).astype(np.int64)
+        words = rng.integers(0, len(LABEL_WORDS), n)
+        # Power-law owner ranks: the top address holds ~2% of names, like the live data
+        owner_ids = (rng.random(n) ** 2.5 * n_owners).astype(np.int64)
+        owner_addresses = ['0x' + rng.bytes(20).hex() for _ in range(n_owners)]
+
+        # Mint dates increase with index so parents are minted before children
+        start = datetime(2023, 6, 1)
+        span = (datetime(2025, 2, 26) - start).total_seconds()
+        offsets = np.sort(rng.random(n)) * span
+
+        names = [''] * n
+        depths = np.zeros(n, dtype=np.int64)
+        tokens = []
+        for i in range(n):
+            label = f"{LABEL_WORDS[words[i]]}{i:x}"
+            parent = parent_draws[i]
+            if i < n_worlds:
+                names[i] = label
+            else:
+                # Keep chains bounded by re-rooting under the parent's world
+                while depths[parent] >= self.max_depth - 1:
+                    parent = parent_draws[parent]
+                names[i] = f"{names[parent]}.{label}"
+                depths[i] = depths[parent] + 1
+
+            tokens.append({
+                'token': {
+                    'chainId': 1,
+                    'contract': CONTRACT_ADDRESS,
+                    'tokenId': str(i + 1),
+                    'name': f"0://{names[i]}",
+                    'description': f"0://{names[i]}, a domain on the ZERO Name Service.",
+                    'kind': 'erc721',
+                    'supply': '1',
+                    'owner': owner_addresses[owner_ids[i]],
+                    'mintedAt': (start + timedelta(seconds=float(offsets[i]))).strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+                }
+            })
+        return tokens
+
+    @property
+    def tokens(self) -> List[Dict[str, Any]]:
+        """All tokens in /tokens/v7 'tokens' entry shape"""
+        if self._tokens is None:
+            self._tokens = self._generate()
+        return self._tokens
+
+    def token_pages(self, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Yield /tokens/v7 response bodies with continuation tokens"""
+        tokens = self.tokens
+        for offset in range(0, len(tokens), page_size):
+            next_offset = offset + page_size
+            yield {
+                'tokens': tokens[offset:next_offset],
+                'continuation': f"page-{next_offset}" if next_offset < len(tokens) else None
+            }
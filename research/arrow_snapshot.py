@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+import tempfile
+from typing import Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# String columns stay Arrow-backed in pandas instead of becoming Python objects
+_TYPES_MAPPER = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow'),
+}.get
+
+
+class ArrowSnapshot:
+    """Immutable Arrow IPC copies of each collection's domains, published per refresh.
+
+    Files are written uncompressed so readers can memory-map them: column
+    buffers are used in place, and every process loading the same version
+    shares the same OS page cache pages. A small CURRENT pointer per
+    collection names the latest file; older files are kept briefly so
+    readers mid-load are never cut off.
+    """
+
+    KEEP_VERSIONS = 2
+
+    def __init__(self, snapshot_dir: str):
+        self.snapshot_dir = snapshot_dir
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+    def _collection_dir(self, key: str) -> str:
+        return os.path.join(self.snapshot_dir, key.replace(':', '_'))
+
+    @staticmethod
+    def _write_atomic(directory: str, suffix: str, write) -> str:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=suffix)
+        os.close(fd)
+        try:
+            write(tmp_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def publish(self, key: str, version: str, df: pd.DataFrame) -> str:
+        """Write df as the snapshot of key at version and point CURRENT at it"""
+        directory = self._collection_dir(key)
+        os.makedirs(directory, exist_ok=True)
+        filename = f"{version.replace(':', '')}.arrow"
+        path = os.path.join(directory, filename)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        def write_table(tmp_path):
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        os.replace(self._write_atomic(directory, '.arrow.tmp', write_table), path)
+
+        def write_pointer(tmp_path):
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': version, 'file': filename}, f)
+
+        os.replace(self._write_atomic(directory, '.json.tmp', write_pointer),
+                   os.path.join(directory, 'CURRENT'))
+
+        self._prune(directory)
+        logger.info(f"Published {len(df)} row snapshot for {key} at {version}")
+        return path
+
+    def _prune(self, directory: str) -> None:
+        snapshots = sorted(f for f in os.listdir(directory) if f.endswith('.arrow'))
+        for filename in snapshots[:-self.KEEP_VERSIONS]:
+            try:
+                # Processes that already mapped the file keep their pages
+                os.remove(os.path.join(directory, filename))
+            except OSError as e:
+                logger.warning(f"Could not remove old snapshot {filename}: {str(e)}")
+
+    def current_version(self, key: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self._collection_dir(key), 'CURRENT')) as f:
+                return json.load(f)['version']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """Give a frame read from elsewhere the dtypes and nulls of a loaded snapshot"""
+        return pa.Table.from_pandas(df, preserve_index=False).to_pandas(types_mapper=_TYPES_MAPPER)
+
+    def load(self, key: str) -> Optional[Tuple[pd.DataFrame, str]]:
+        """Memory-map the current snapshot of key, or None if there is none"""
+        directory = self._collection_dir(key)
+        try:
+            with open(os.path.join(directory, 'CURRENT')) as f:
+                pointer = json.load(f)
+            source = pa.memory_map(os.path.join(directory, pointer['file']), 'r')
+            table = pa.ipc.open_file(source).read_all()
+        except (OSError, ValueError, KeyError, pa.ArrowInvalid) as e:
+            logger.debug(f"No usable snapshot for {key}: {str(e)}")
+            return None
+
+        return table.to_pandas(types_mapper=_TYPES_MAPPER), pointer['version']
@@ -0,0 +1,52 @@
+import json
+import os
+from typing import List, Dict, Tuple
+
+# Reservoir serves each chain from its own host
+RESERVOIR_BASE_URLS = {
+    'ethereum': "https://api.reservoir.tools",
+    'base': "https://api-base.reservoir.tools",
+    'polygon': "https://api-polygon.reservoir.tools",
+    'arbitrum': "https://api-arbitrum.reservoir.tools",
+    'optimism': "https://api-optimism.reservoir.tools",
+    'zora': "https://api-zora.reservoir.tools",
+}
+
+DEFAULT_CHAIN = 'ethereum'
+DEFAULT_COLLECTION = '0xc14ea65f0a478c649b7a037bc0ad0a765b49196b'
+
+DEFAULT_COLLECTIONS = [
+    {'chain': DEFAULT_CHAIN, 'collection': DEFAULT_COLLECTION, 'label': 'ZERO ID'},
+]
+
+
+def collection_key(chain: str, collection: str) -> str:
+    """Stable string key for a (chain, collection) pair"""
+    return f"{chain}:{collection.lower()}"
+
+
+def parse_collection_key(key: str) -> Tuple[str, str]:
+    chain, collection = key.split(':', 1)
+    return chain, collection
+
+
+def load_collections() -> List[Dict[str, str]]:
+    """Tracked collections, overridable with a ZNS_COLLECTIONS JSON list of
+    {"chain": ..., "collection": ..., "label": ...} objects.
+    """
+    raw = os.getenv('ZNS_COLLECTIONS')
+    collections = json.loads(raw) if raw else DEFAULT_COLLECTIONS
+
+    normalized = []
+    for entry in collections:
+        chain = entry.get('chain', DEFAULT_CHAIN)
+        if chain not in RESERVOIR_BASE_URLS:
+            raise ValueError(f"Unsupported chain '{chain}', expected one of {sorted(RESERVOIR_BASE_URLS)}")
+        collection = entry['collection'].lower()
+        normalized.append({
+            'chain': chain,
+            'collection': collection,
+            'label': entry.get('label') or f"{chain}:{collection[:10]}",
+            'key': collection_key(chain, collection),
+        })
+    return normalized
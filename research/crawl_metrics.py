@@ -0,0 +1,77 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List
+from datetime import datetime
+
+
+class CrawlMetrics:
+    """Counters and phase timings for one Reservoir crawl, persisted to crawl_runs"""
+
+    COUNTERS = ['pages_fetched', 'tokens_fetched', 'rate_limit_hits', 'request_errors',
+                'bytes_received', 'domains_saved']
+    # pacing_seconds is the routine wait for a request slot; backoff_seconds only
+    # counts 429 penalties and error backoffs
+    TIMERS = ['fetch_seconds', 'pacing_seconds', 'backoff_seconds', 'parse_seconds', 'db_write_seconds']
+
+    def __init__(self, chain: str = None, collection: str = None):
+        self.chain = chain
+        self.collection = collection
+        self.started_at = datetime.now()
+        self.finished_at = None
+        self.status = 'running'
+        self.counters = {name: 0 for name in self.COUNTERS}
+        self.timers = {name: 0.0 for name in self.TIMERS}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timers[name] += seconds
+
+    @contextmanager
+    def timer(self, name: str):
+        """Accumulate wall time spent inside the block under the given timer"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        self.finished_at = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat summary, including derived throughput"""
+        end = self.finished_at or datetime.now()
+        duration = (end - self.started_at).total_seconds()
+        summary = {
+            'chain': self.chain,
+            'collection': self.collection,
+            'started_at': self.started_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'status': self.status,
+            'duration_seconds': round(duration, 3),
+            **self.counters,
+            **{name: round(value, 3) for name, value in self.timers.items()},
+        }
+        summary['tokens_per_second'] = round(self.counters['tokens_fetched'] / duration, 3) if duration > 0 else 0.0
+        return summary
+
+    def save(self, db_file: str) -> None:
+        """Insert this run into the crawl_runs table"""
+        summary = self.to_dict()
+        columns = ', '.join(summary)
+        placeholders = ', '.join('?' for _ in summary)
+        with sqlite3.connect(db_file, timeout=60) as conn:
+            conn.execute(f"INSERT INTO crawl_runs ({columns}) VALUES ({placeholders})",
+                         list(summary.values()))
+
+    @staticmethod
+    def load_recent(db_file: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return the most recent crawl runs, newest first"""
+        with sqlite3.connect(db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("SELECT * FROM crawl_runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in rows]
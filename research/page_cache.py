@@ -0,0 +1,152 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import List, Dict, Any, Optional, Iterator
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.getenv('ZNS_PAGE_CACHE_MB', '512')) * 1024 * 1024
+
+
+class PageCache:
+    """Content-addressed store of raw Reservoir page responses.
+
+    Each response body is gzipped under objects/<sha256[:2]>/<sha256>.gz,
+    and each crawl writes a manifest listing its page digests in order, so
+    the latest crawl can be re-parsed without touching the network.
+    Identical pages across crawls are stored once.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.manifests_dir = os.path.join(cache_dir, 'manifests')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.gz")
+
+    @staticmethod
+    def _atomic_write(path: str, payload: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def put(self, body: bytes) -> str:
+        """Store a raw response body and return its digest"""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            # Refresh recency so eviction keeps pages the latest crawl still uses
+            os.utime(path)
+        else:
+            self._atomic_write(path, gzip.compress(body, compresslevel=6))
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the raw response body for a digest"""
+        with open(self._object_path(digest), 'rb') as f:
+            return gzip.decompress(f.read())
+
+    def write_manifest(self, run_id: str, digests: List[str], complete: bool,
+                       extra: Optional[Dict[str, Any]] = None) -> None:
+        """Record the ordered page digests of one crawl"""
+        manifest = {
+            'run_id': run_id,
+            'written_at': datetime.now().isoformat(),
+            'complete': complete,
+            'pages': digests,
+            **(extra or {})
+        }
+        self._atomic_write(os.path.join(self.manifests_dir, f"{run_id}.json"),
+                           json.dumps(manifest).encode('utf-8'))
+
+    def list_manifests(self) -> List[Dict[str, Any]]:
+        """All manifests, newest first"""
+        manifests = []
+        for filename in os.listdir(self.manifests_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.manifests_dir, filename)) as f:
+                    manifests.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable page cache manifest {filename}: {str(e)}")
+        return sorted(manifests, key=lambda m: m['written_at'], reverse=True)
+
+    def latest_manifest(self, chain: Optional[str] = None,
+                        collection: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Newest manifest of a crawl that ran to completion, optionally for one collection"""
+        for manifest in self.list_manifests():
+            if not manifest['complete']:
+                continue
+            if chain is not None and manifest.get('chain', 'ethereum') != chain:
+                continue
+            if collection is not None and manifest.get('collection', '').lower() != collection.lower():
+                continue
+            return manifest
+        return None
+
+    def iter_pages(self, manifest: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the decoded JSON pages of a manifest in crawl order"""
+        for digest in manifest['pages']:
+            yield json.loads(self.get(digest))
+
+    def evict(self) -> int:
+        """Drop least recently used objects until the cache fits max_bytes.
+
+        Pages of the newest complete crawl of each collection are never
+        evicted. Manifests left pointing at evicted pages are removed.
+        Returns bytes freed.
+        """
+        protected = set()
+        seen = set()
+        for manifest in self.list_manifests():
+            scope = (manifest.get('chain', 'ethereum'), manifest.get('collection', '').lower())
+            if manifest['complete'] and scope not in seen:
+                seen.add(scope)
+                protected.update(manifest['pages'])
+
+        objects = []
+        total = 0
+        for root, _, files in os.walk(self.objects_dir):
+            for filename in files:
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                total += stat.st_size
+                objects.append((stat.st_mtime, stat.st_size, filename[:-3], path))
+
+        if total <= self.max_bytes:
+            return 0
+
+        freed = 0
+        evicted = set()
+        for _, size, digest, path in sorted(objects):
+            if total - freed <= self.max_bytes:
+                break
+            if digest in protected:
+                continue
+            os.remove(path)
+            freed += size
+            evicted.add(digest)
+
+        for manifest in self.list_manifests():
+            if evicted.intersection(manifest['pages']):
+                os.remove(os.path.join(self.manifests_dir, f"{manifest['run_id']}.json"))
+
+        logger.info(f"Evicted {len(evicted)} cached pages ({freed / (1024 * 1024):.1f} MB)")
+        return freed
@@ -0,0 +1,52 @@
+import sqlite3
+import time
+
+
+class RateLimiter:
+    """Request pacing shared by every process crawling with the same key.
+
+    Each key (a Reservoir host) has a next-free-slot time in a small SQLite
+    table. Callers reserve the next slot inside an IMMEDIATE transaction
+    and sleep until it, so parallel crawls against one host together stay
+    within its limit while different hosts run independently.
+    """
+
+    def __init__(self, db_file: str, key: str, requests_per_second: float = 2.0):
+        self.db_file = db_file
+        self.key = key
+        self.interval = 1.0 / requests_per_second
+
+        with sqlite3.connect(self.db_file, timeout=30) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limits (
+                    key TEXT PRIMARY KEY,
+                    next_slot REAL
+                )
+            """)
+
+    def acquire(self) -> float:
+        """Block until this caller may send a request; returns seconds waited"""
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT next_slot FROM rate_limits WHERE key = ?", (self.key,)).fetchone()
+            now = time.time()
+            slot = max(now, row[0]) if row else now
+            conn.execute("INSERT OR REPLACE INTO rate_limits (key, next_slot) VALUES (?, ?)",
+                         (self.key, slot + self.interval))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Push every caller on this key back, e.g. after a 429"""
+        with sqlite3.connect(self.db_file, timeout=30) as conn:
+            conn.execute("""
+                INSERT INTO rate_limits (key, next_slot) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET next_slot = MAX(next_slot, excluded.next_slot)
+            """, (self.key, time.time() + seconds))
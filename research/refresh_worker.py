@@ -0,0 +1,335 @@
+import sqlite3
+import logging
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Any
+from datetime import datetime, timedelta
+from research.collection_registry import load_collections, parse_collection_key
+from research.snapshot_importer import SnapshotImporter
+from research.zero_study_research import DB_WRITE_TIMEOUT, SAVE_ATTEMPTS
+from utils.figure_cache import FigureCache
+from utils.shared_cache import SharedCache, SHARED_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+FETCH_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'scripts', 'fetch_data.py')
+
+# Separate hosts have separate rate limits, so a few crawls can overlap usefully
+MAX_PARALLEL_CRAWLS = int(os.getenv('ZNS_MAX_PARALLEL_CRAWLS', '4'))
+
+# Seconds between heartbeats written by the lock holder, whatever the crawl is waiting on
+HEARTBEAT_INTERVAL = 30
+
+# refresh_message while the lock is held for a bundled snapshot import rather than a crawl
+BOOTSTRAP_MESSAGE = 'bootstrap'
+
+
+def _crawl_collection(db_file: str, key: str, reprocess: bool) -> Dict[str, Any]:
+    """Crawl one collection in a worker process and summarize the outcome.
+
+    Module level so ProcessPoolExecutor can pickle it.
+    """
+    from research.zero_study_research import ZeroStudyResearcher
+
+    chain, collection = parse_collection_key(key)
+    researcher = ZeroStudyResearcher(db_file=db_file, chain=chain, collection=collection)
+    worker = RefreshWorker(researcher)
+    try:
+        if reprocess:
+            domains_data, _ = researcher.reprocess_cached_pages()
+        else:
+            domains_data, _ = researcher.get_nft_data(
+                force_refresh=True, progress_callback=lambda n: worker.report_progress(n, key))
+        error = None if domains_data else "No domain data fetched"
+    except Exception as e:
+        domains_data, error = [], str(e)
+
+    metrics = researcher.last_crawl_metrics
+    return {
+        'key': key,
+        'domains': len(domains_data),
+        'error': error,
+        'metrics': metrics.to_dict() if metrics is not None else None
+    }
+
+
+class RefreshWorker:
+    """Single-flight background refresh coordinated through the metadata table.
+
+    The lock and progress live in the same SQLite database as the data, so
+    every Streamlit process sees the same refresh state and only one crawl
+    can run at a time.
+    """
+
+    # A running refresh whose heartbeat is this old is considered dead. The
+    # heartbeat itself needs the write lock, so this outlasts the longest a
+    # save can wait for it, plus some slack
+    STALE_AFTER = timedelta(seconds=DB_WRITE_TIMEOUT * SAVE_ATTEMPTS) + timedelta(minutes=5)
+
+    STATUS_KEYS = ['refresh_status', 'refresh_started_at', 'refresh_heartbeat',
+                   'refresh_progress', 'refresh_finished_at', 'refresh_message']
+
+    def __init__(self, researcher):
+        self.researcher = researcher
+        self.db_file = researcher.db_file
+        self.last_results: List[Dict[str, Any]] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def _set(cursor: sqlite3.Cursor, values: Dict[str, str]) -> None:
+        cursor.executemany("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                           list(values.items()))
+
+    def get_status(self) -> Dict[str, Optional[str]]:
+        """Return the current refresh state from the metadata table"""
+        try:
+            conn = self._connect()
+            try:
+                placeholders = ', '.join('?' for _ in self.STATUS_KEYS)
+                rows = conn.execute(f"SELECT key, value FROM metadata WHERE key IN ({placeholders})",
+                                    self.STATUS_KEYS).fetchall()
+                per_collection = conn.execute(
+                    "SELECT value FROM metadata WHERE key LIKE 'refresh_progress:%'").fetchall()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Error reading refresh status: {str(e)}")
+            rows, per_collection = [], []
+
+        status = {key: None for key in self.STATUS_KEYS}
+        status.update(dict(rows))
+        if per_collection:
+            # Parallel crawls report separately; show their combined token count
+            status['refresh_progress'] = str(sum(int(value) for value, in per_collection))
+        if status['refresh_status'] == 'running' and self._is_stale(status):
+            status['refresh_status'] = 'stale'
+        return status
+
+    def is_running(self) -> bool:
+        return self.get_status()['refresh_status'] == 'running'
+
+    def _is_stale(self, status: Dict[str, Optional[str]]) -> bool:
+        heartbeat = status.get('refresh_heartbeat')
+        if not heartbeat:
+            return True
+        return datetime.now() - datetime.fromisoformat(heartbeat) > self.STALE_AFTER
+
+    def try_acquire(self, message: str = '') -> bool:
+        """Take the refresh lock unless another live refresh holds it"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("SELECT key, value FROM metadata WHERE key LIKE 'refresh_%'").fetchall()
+            status = dict(rows)
+            if status.get('refresh_status') == 'running' and not self._is_stale(status):
+                conn.execute("ROLLBACK")
+                logger.info("Refresh already in progress, not starting another")
+                return False
+
+            now = datetime.now().isoformat()
+            conn.execute("DELETE FROM metadata WHERE key LIKE 'refresh_progress:%'")
+            self._set(conn.cursor(), {
+                'refresh_status': 'running',
+                'refresh_started_at': now,
+                'refresh_heartbeat': now,
+                'refresh_progress': '0',
+                'refresh_message': message or f"pid {os.getpid()}"
+            })
+            conn.execute("COMMIT")
+            return True
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def report_progress(self, tokens_fetched: int, key: Optional[str] = None) -> None:
+        """Record crawl progress (per collection key if given) and refresh the lock heartbeat"""
+        try:
+            conn = self._connect()
+            try:
+                self._set(conn.cursor(), {
+                    f"refresh_progress:{key}" if key else 'refresh_progress': str(tokens_fetched),
+                    'refresh_heartbeat': datetime.now().isoformat()
+                })
+            finally:
+                conn.close()
+        except Exception as e:
+            # Progress reporting must never abort the crawl
+            logger.warning(f"Could not record refresh progress: {str(e)}")
+
+    @contextmanager
+    def heartbeat(self):
+        """Refresh the lock heartbeat from a timer thread for the duration of the block.
+
+        Crawls can go minutes without a successful page (rate limit
+        penalties, error backoffs, waiting for the write lock), so liveness
+        must not depend on progress reports.
+        """
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(HEARTBEAT_INTERVAL):
+                try:
+                    conn = self._connect()
+                    try:
+                        self._set(conn.cursor(), {'refresh_heartbeat': datetime.now().isoformat()})
+                    finally:
+                        conn.close()
+                except Exception as e:
+                    logger.warning(f"Could not record refresh heartbeat: {str(e)}")
+
+        thread = threading.Thread(target=beat, name='refresh-heartbeat', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def release(self, status: str, message: str = '') -> None:
+        """Release the lock, recording how the refresh ended"""
+        conn = self._connect()
+        try:
+            self._set(conn.cursor(), {
+                'refresh_status': status,
+                'refresh_finished_at': datetime.now().isoformat(),
+                'refresh_message': message
+            })
+        finally:
+            conn.close()
+
+    def run(self, reprocess: bool = False, collections: Optional[List[str]] = None) -> bool:
+        """Refresh the given collection keys (default: all configured) if the lock is free.
+
+        Collections are crawled in parallel worker processes, each paced by
+        its chain's shared rate limiter. With reprocess=True the domains are
+        rebuilt from the page cache instead of crawling Reservoir. Returns
+        True only if every collection saved data.
+        """
+        keys = collections or [entry['key'] for entry in load_collections()]
+        if not self.try_acquire():
+            return False
+
+        try:
+            with self.heartbeat():
+                if len(keys) == 1:
+                    self.last_results = [_crawl_collection(self.db_file, keys[0], reprocess)]
+                else:
+                    with ProcessPoolExecutor(max_workers=min(len(keys), MAX_PARALLEL_CRAWLS)) as pool:
+                        self.last_results = list(pool.map(
+                            _crawl_collection, [self.db_file] * len(keys), keys, [reprocess] * len(keys)))
+                failed = [result for result in self.last_results if result['error']]
+                self.refresh_caches(warm=not failed)
+        except BaseException as e:
+            self.release('failed', str(e))
+            raise
+
+        summary = '; '.join(
+            f"{result['key']}: {result['error'] or 'saved ' + str(result['domains']) + ' domains'}"
+            for result in self.last_results)
+        self.release('failed' if failed else 'completed', summary)
+        return not failed
+
+    def bootstrap_status(self) -> Optional[str]:
+        """How the bundled snapshot import into this collection ended, if it ran"""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT value FROM metadata WHERE key = ?",
+                                   (f"bootstrap_status:{self.researcher.collection_key}",)).fetchone()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Error reading bootstrap status: {str(e)}")
+            return None
+        return row[0] if row else None
+
+    def bootstrap(self) -> bool:
+        """Import the newest bundled export into an empty collection if the lock is free.
+
+        The outcome is recorded under bootstrap_status:<collection key>, so
+        a broken export is tried once instead of on every page load.
+        Returns True if the import succeeded.
+        """
+        if not self.try_acquire(BOOTSTRAP_MESSAGE):
+            return False
+
+        key = self.researcher.collection_key
+        try:
+            with self.heartbeat():
+                imported = SnapshotImporter(self.researcher).bootstrap()
+        except Exception as e:
+            self._record_bootstrap('failed')
+            self.release('failed', f"{key}: could not import bundled snapshot: {str(e)}")
+            return False
+        except BaseException as e:
+            # Interrupted rather than broken, so a later page load may try again
+            self.release('failed', str(e))
+            raise
+
+        self._record_bootstrap('completed')
+        self.refresh_caches()
+        self.release('completed', f"{key}: imported {imported} domains from bundled snapshot")
+        return True
+
+    def _record_bootstrap(self, status: str) -> None:
+        conn = self._connect()
+        try:
+            self._set(conn.cursor(), {f"bootstrap_status:{self.researcher.collection_key}": status})
+        finally:
+            conn.close()
+
+    def refresh_caches(self, warm: bool = True) -> None:
+        """Drop shared cache entries from older data and pre-render the default views; never raises"""
+        try:
+            keys = [entry['key'] for entry in load_collections()]
+            df, last_updated = self.researcher.load_saved_frame(keys)
+            version = last_updated.isoformat()
+            shared_cache = SharedCache(os.path.join(os.path.dirname(self.db_file), SHARED_CACHE_FILE))
+            shared_cache.invalidate(version)
+            if warm and not df.empty:
+                built = FigureCache(shared_cache).warm_default_views(version, keys, df)
+                logger.info(f"Pre-rendered {built} default figures")
+        except Exception as e:
+            # A cold cache only costs the first viewer a rebuild
+            logger.warning(f"Could not refresh shared caches: {str(e)}")
+
+    def launch(self, bootstrap: bool = False, reprocess: bool = False,
+               collections: Optional[List[str]] = None) -> bool:
+        """Start scripts/fetch_data.py as a detached process.
+
+        With bootstrap=True the child imports the bundled snapshot instead
+        of crawling; reprocess and collections are passed on as in run().
+        The child takes the lock itself, so launching while a
+        refresh is already running is harmless. Returns False if a live
+        refresh was already in progress.
+        """
+        if self.is_running():
+            return False
+
+        command = [sys.executable, FETCH_SCRIPT]
+        if bootstrap:
+            command.append('--bootstrap')
+        if reprocess:
+            command.append('--reprocess')
+        for key in collections or []:
+            command += ['--collection', key]
+
+        log_path = os.path.join(os.path.dirname(self.db_file), 'refresh.log')
+        with open(log_path, 'a') as log_file:
+            subprocess.Popen(command,
+                             stdout=log_file,
+                             stderr=subprocess.STDOUT,
+                             stdin=subprocess.DEVNULL,
+                             start_new_session=True)
+        logger.info(f"Launched background {'snapshot import' if bootstrap else 'refresh'} (log: {log_path})")
+        return True
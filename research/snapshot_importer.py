@@ -0,0 +1,297 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from research.zero_study_research import DB_WRITE_TIMEOUT
+from utils.name_parser import NAME_PREFIX, NameParser
+
+logger = logging.getLogger(__name__)
+
+# Legacy exports shipped in data/, newest first; older ones are only fallbacks
+BOOTSTRAP_FILES = ['reservoir_data.json', 'nft_data_cache.json']
+
+# Key holding the records in {"domains_data": [...], "last_updated": ...} exports
+RECORDS_KEY = 'domains_data'
+
+READ_SIZE = 1024 * 1024
+IMPORT_BATCH = 10000
+# Page cache for the import connection; index updates thrash SQLite's 2 MB default
+IMPORT_CACHE_KIB = 256 * 1024
+
+DOMAIN_FIELDS = ['name', 'owner', 'world', 'root_domain', 'domain', 'is_subdomain', 'member_count', 'mint_date']
+# Taken from NameParser rather than the export, so every stored row obeys the naming rules
+PARSED_FIELDS = ['world', 'root_domain', 'domain', 'is_subdomain']
+
+_NON_WHITESPACE = re.compile(r'\S')
+_DECODER = json.JSONDecoder()
+
+
+class JsonRecordStream:
+    """Domain records of a JSON export, decoded one at a time.
+
+    Accepts a bare list of records or an object whose RECORDS_KEY holds
+    them. Only one READ_SIZE window and the current record are held in
+    memory; any other top-level values (such as last_updated) are
+    collected into metadata as they are passed.
+    """
+
+    def __init__(self, path: str, read_size: int = READ_SIZE):
+        self.path = path
+        self.read_size = read_size
+        self.metadata: Dict[str, Any] = {}
+        self._file: Optional[TextIO] = None
+        self._text = ''
+        self._pos = 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, encoding='utf-8') as f:
+            self._file, self._text, self._pos = f, '', 0
+            start = self._peek()
+            if start == '[':
+                self._pos += 1
+                yield from self._items()
+            elif start == '{':
+                self._pos += 1
+                yield from self._object()
+            else:
+                raise ValueError(f"{self.path} is not a JSON list or object")
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping everything already consumed"""
+        chunk = self._file.read(self.read_size)
+        if not chunk:
+            return False
+        self._text = self._text[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of file)"""
+        while True:
+            match = _NON_WHITESPACE.search(self._text, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._text[self._pos]
+            self._pos = len(self._text)
+            if not self._fill():
+                return ''
+
+    def _separator(self, closing: str) -> bool:
+        """Consume ',' (True) or the closing bracket (False)"""
+        char = self._peek()
+        self._pos += 1
+        if char == closing:
+            return False
+        if char != ',':
+            raise ValueError(f"Malformed JSON in {self.path}: expected ',' or '{closing}'")
+        return True
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError:
+                # Value continues past the window
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by the window end decodes as a shorter one, so it needs a visible delimiter
+            if not isinstance(value, (dict, list, str)):
+                following = _NON_WHITESPACE.search(self._text, end)
+                if (following is None or following.group() not in ',]}') and self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def _items(self) -> Iterator[Any]:
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if not self._separator(']'):
+                return
+
+    def _object(self) -> Iterator[Dict[str, Any]]:
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if self._peek() != ':':
+                raise ValueError(f"Malformed JSON in {self.path}: expected ':'")
+            self._pos += 1
+            if key == RECORDS_KEY and self._peek() == '[':
+                self._pos += 1
+                yield from self._items()
+            else:
+                self.metadata[key] = self._value()
+            if not self._separator('}'):
+                return
+
+
+def _naive_timestamp(value: str) -> str:
+    """ISO timestamp in naive local time, like datetime.now() in save_data"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+class SnapshotImporter:
+    """Bulk-loads JSON exports into the researcher's collection.
+
+    Files are streamed into the domains table in IMPORT_BATCH row inserts
+    inside one transaction, so readers see either the previous rows or the
+    whole import. Names go through NameParser like crawled ones: invalid
+    names are recorded as rejected, the hierarchy columns come from the
+    parser and member counts are recounted over the imported rows. Where
+    files overlap, the first file's record for a name wins. Owner
+    summaries, sketches and graph metrics are left to the next refresh;
+    the app derives what it needs until then.
+    """
+
+    def __init__(self, researcher):
+        self.researcher = researcher
+        self.db_file = researcher.db_file
+
+    def bootstrap_paths(self) -> List[str]:
+        """Bundled exports present next to the database"""
+        data_dir = os.path.dirname(self.db_file)
+        paths = [os.path.join(data_dir, name) for name in BOOTSTRAP_FILES]
+        return [path for path in paths if os.path.exists(path)]
+
+    def bootstrap(self, replace: bool = False) -> int:
+        """Import the newest bundled export into an empty collection; returns rows imported.
+
+        Exports are not merged, since an older one would add names the
+        newer one dropped. Older exports are only tried if a newer one
+        fails to load; if none loads, the newest one's error is raised.
+        """
+        errors = []
+        for path in self.bootstrap_paths():
+            try:
+                return self.import_files([path], replace=replace)
+            except Exception as e:
+                logger.warning(f"Could not bootstrap from {path}: {str(e)}")
+                errors.append(e)
+        if errors:
+            raise errors[0]
+        return 0
+
+    def import_files(self, paths: List[str], replace: bool = False) -> int:
+        """Import records from paths; returns rows imported.
+
+        Unless replace is set, a collection that already has rows is left
+        alone and 0 is returned. The collection's timestamp is the newest
+        last_updated among the files, else the newest mint date.
+        """
+        scope = (self.researcher.chain, self.researcher.contract_address)
+        conn = sqlite3.connect(self.db_file, timeout=DB_WRITE_TIMEOUT, isolation_level=None)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"PRAGMA cache_size = -{IMPORT_CACHE_KIB}")
+            # Take the write lock before checking, so concurrent app processes import once
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT 1 FROM domains WHERE chain = ? AND collection = ? LIMIT 1", scope)
+            if cursor.fetchone() and not replace:
+                cursor.execute("ROLLBACK")
+                logger.info(f"{self.researcher.collection_key} already has data, skipping import")
+                return 0
+            # Derived tables would describe the replaced rows; readers rebuild them until the next save
+            for table in ('domains', 'owners', 'world_sketches', 'rejected_names'):
+                cursor.execute(f"DELETE FROM {table} WHERE chain = ? AND collection = ?", scope)
+
+            imported = 0
+            rejected = []
+            timestamps = []
+            latest_mint = ''
+            columns = ', '.join(['chain', 'collection'] + DOMAIN_FIELDS)
+            placeholders = ', '.join('?' for _ in range(len(DOMAIN_FIELDS) + 2))
+            for path in paths:
+                stream = JsonRecordStream(path)
+                batch = []
+                for record in stream:
+                    if not isinstance(record, dict):
+                        continue
+                    batch.append(record)
+                    latest_mint = max(latest_mint, record.get('mint_date') or '')
+                    if len(batch) >= IMPORT_BATCH:
+                        imported += self._insert(cursor, columns, placeholders, scope, batch, rejected)
+                        batch = []
+                imported += self._insert(cursor, columns, placeholders, scope, batch, rejected)
+                if stream.metadata.get('last_updated'):
+                    timestamps.append(_naive_timestamp(stream.metadata['last_updated']))
+                logger.info(f"Streamed {path}")
+
+            if timestamps:
+                version = max(timestamps)
+            elif latest_mint:
+                version = _naive_timestamp(latest_mint)
+            else:
+                version = datetime(2000, 1, 1).isoformat()
+
+            # Parsed member counts only cover one batch, so count children over the whole import
+            cursor.execute("""
+                UPDATE domains SET member_count = counts.members
+                FROM (
+                    SELECT root_domain, COUNT(*) AS members FROM domains
+                    WHERE chain = ? AND collection = ? AND is_subdomain
+                    GROUP BY root_domain
+                ) AS counts
+                WHERE domains.chain = ? AND domains.collection = ?
+                  AND substr(domains.name, ?) = counts.root_domain
+            """, (*scope, *scope, len(NAME_PREFIX) + 1))
+            if rejected:
+                logger.warning(f"Rejected {len(rejected)} names that break ZNS naming rules")
+                cursor.executemany("""
+                    INSERT INTO rejected_names (chain, collection, refreshed_at, name, reason)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(*scope, version, name, reason) for name, reason in rejected])
+            cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                           (f"last_updated:{self.researcher.collection_key}", version))
+            # Never move the global data version backwards
+            cursor.execute("""
+                INSERT INTO metadata (key, value) VALUES ('last_updated', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value WHERE excluded.value > metadata.value
+            """, (version,))
+            cursor.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Error importing snapshots: {str(e)}")
+            raise
+        finally:
+            conn.close()
+
+        logger.info(f"Imported {imported} domains into {self.researcher.collection_key} (data as of {version})")
+        # Publish the Arrow snapshot now rather than on the first page load
+        self.researcher.load_collection_frame(self.researcher.collection_key)
+        return imported
+
+    @staticmethod
+    def _insert(cursor: sqlite3.Cursor, columns: str, placeholders: str, scope: Tuple[str, str],
+                batch: List[Dict[str, Any]], rejected: List[Tuple[Any, str]]) -> int:
+        """Insert a batch's valid names, appending (name, reason) for the rest to rejected"""
+        if not batch:
+            return 0
+        parsed = NameParser.parse([record.get('name') for record in batch])
+        rows = []
+        for record, parsed_row in zip(batch, parsed.itertuples(index=False)):
+            if not parsed_row.valid:
+                name = record.get('name')
+                rejected.append((name if isinstance(name, str) else None, parsed_row.reason))
+                continue
+            values = {**record, **{field: getattr(parsed_row, field) for field in PARSED_FIELDS}}
+            values['is_subdomain'] = bool(values['is_subdomain'])
+            # Recounted once the whole import is in
+            values['member_count'] = 0
+            rows.append((*scope, *(values.get(field) for field in DOMAIN_FIELDS)))
+        before = cursor.connection.total_changes
+        cursor.executemany(f"INSERT OR IGNORE INTO domains ({columns}) VALUES ({placeholders})", rows)
+        return cursor.connection.total_changes - before
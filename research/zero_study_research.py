@@ -5,8 +5,19 @@ import json
 import os
 import requests
 import time
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable, Optional
 from datetime import datetime
+from utils.owner_index import OwnerIndex
+from utils.snapshot_diff import SnapshotDiffer
+from utils.name_parser import NameParser
+from utils.world_sketch import WorldSketches
+from utils.graph_analytics import DomainGraph, ANALYTICS_COLUMNS
+from research.crawl_metrics import CrawlMetrics
+from research.page_cache import PageCache
+from research.rate_limiter import RateLimiter
+from research.arrow_snapshot import ArrowSnapshot
+from research.collection_registry import (RESERVOIR_BASE_URLS, DEFAULT_CHAIN, DEFAULT_COLLECTION,
+                                          collection_key, parse_collection_key)
 
 # Set up logging
 logging.basicConfig(
@@ -15,38 +26,177 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parallel collection crawls queue behind each other's saves, which hold the
+# write lock for tens of seconds at 1M names
+DB_WRITE_TIMEOUT = 300
+SAVE_ATTEMPTS = 3
+
 class ZeroStudyResearcher:
-    def __init__(self):
+    def __init__(self, db_file: str = "data/reservoir_data.db",
+                 chain: str = DEFAULT_CHAIN, collection: str = DEFAULT_COLLECTION):
         self.api_key = os.getenv('RESERVOIR_API_KEY')
         if not self.api_key:
             raise ValueError("RESERVOIR_API_KEY environment variable is not set")
+        if chain not in RESERVOIR_BASE_URLS:
+            raise ValueError(f"Unsupported chain '{chain}'")
 
-        self.contract_address = '0xC14ea65f0a478C649B7a037bC0aD0a765b49196B'
-        self.base_url = "https://api.reservoir.tools"
-        self.db_file = "data/reservoir_data.db"
+        # Crawls and saves are scoped to this (chain, collection) pair
+        self.chain = chain
+        self.contract_address = collection.lower()
+        self.collection_key = collection_key(chain, collection)
+        self.base_url = RESERVOIR_BASE_URLS[chain]
+        self.db_file = db_file
+        self.last_crawl_metrics = None
 
         # Ensure data directory exists
-        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        data_dir = os.path.dirname(self.db_file)
+        os.makedirs(data_dir, exist_ok=True)
+
+        # Raw page responses, kept so parsing changes don't need a re-crawl
+        self.page_cache = PageCache(os.path.join(data_dir, 'page_cache'))
+
+        # Memory-mappable copy of each collection, published on every save
+        self.snapshots = ArrowSnapshot(os.path.join(data_dir, 'snapshots'))
+
+        # Pacing is per Reservoir host and shared by every crawling process
+        self.rate_limiter = RateLimiter(os.path.join(data_dir, 'rate_limits.db'), key=self.base_url)
 
         # Initialize database
         self._init_db()
 
+    @classmethod
+    def open_read_only(cls, db_file: str = "data/reservoir_data.db",
+                       chain: str = DEFAULT_CHAIN, collection: str = DEFAULT_COLLECTION) -> 'ZeroStudyResearcher':
+        """Researcher over an existing database, for serving reads only.
+
+        Needs no API key and has no crawl client, page cache or rate
+        limiter, and never migrates or writes the database. Arrow snapshots
+        beside it are still republished when stale.
+        """
+        if not os.path.exists(db_file):
+            raise FileNotFoundError(f"Database {db_file} does not exist")
+        if chain not in RESERVOIR_BASE_URLS:
+            raise ValueError(f"Unsupported chain '{chain}'")
+
+        researcher = cls.__new__(cls)
+        researcher.api_key = None
+        researcher.chain = chain
+        researcher.contract_address = collection.lower()
+        researcher.collection_key = collection_key(chain, collection)
+        researcher.base_url = RESERVOIR_BASE_URLS[chain]
+        researcher.db_file = db_file
+        researcher.last_crawl_metrics = None
+        researcher.page_cache = None
+        researcher.rate_limiter = None
+        researcher.snapshots = ArrowSnapshot(os.path.join(os.path.dirname(db_file), 'snapshots'))
+        return researcher
+
     def _init_db(self):
         """Initialize SQLite database with schema"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            # Waits behind another process's migration or save rather than failing
+            with sqlite3.connect(self.db_file, timeout=DB_WRITE_TIMEOUT) as conn:
                 cursor = conn.cursor()
+                # WAL lets readers keep serving the previous snapshot while a refresh writes
+                cursor.execute("PRAGMA journal_mode=WAL")
+                self._migrate_schema(cursor)
                 # Create domains table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS domains (
-                        name TEXT PRIMARY KEY,
+                        chain TEXT NOT NULL,
+                        collection TEXT NOT NULL,
+                        name TEXT NOT NULL,
                         owner TEXT,
                         world TEXT,
                         root_domain TEXT,
                         domain TEXT,
                         is_subdomain BOOLEAN,
                         member_count INTEGER,
-                        mint_date TEXT
+                        mint_date TEXT,
+                        subtree_size INTEGER,
+                        owner_component INTEGER,
+                        component_size INTEGER,
+                        influence REAL,
+                        PRIMARY KEY (chain, collection, name)
+                    )
+                """)
+                self._add_missing_columns(cursor, 'domains', ANALYTICS_COLUMNS)
+                # Owner lookups all go through lower(owner) or a full scan, so this index only slowed saves
+                cursor.execute("DROP INDEX IF EXISTS idx_domains_owner")
+                # Create owners table, rebuilt from domains on every save
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS owners (
+                        chain TEXT NOT NULL,
+                        collection TEXT NOT NULL,
+                        owner TEXT NOT NULL,
+                        domain_count INTEGER,
+                        first_mint TEXT,
+                        last_mint TEXT,
+                        PRIMARY KEY (chain, collection, owner)
+                    )
+                """)
+                # Create changelog table, one row per change between refreshes
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS changelog (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        chain TEXT,
+                        collection TEXT,
+                        refreshed_at TEXT,
+                        name TEXT,
+                        change_type TEXT,
+                        old_owner TEXT,
+                        new_owner TEXT,
+                        old_member_count INTEGER,
+                        new_member_count INTEGER
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_changelog_refreshed_at ON changelog (refreshed_at)
+                """)
+                # Create crawl_runs table, one row of telemetry per crawl
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_runs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        chain TEXT,
+                        collection TEXT,
+                        started_at TEXT,
+                        finished_at TEXT,
+                        status TEXT,
+                        duration_seconds REAL,
+                        pages_fetched INTEGER,
+                        tokens_fetched INTEGER,
+                        rate_limit_hits INTEGER,
+                        request_errors INTEGER,
+                        bytes_received INTEGER,
+                        domains_saved INTEGER,
+                        fetch_seconds REAL,
+                        pacing_seconds REAL,
+                        backoff_seconds REAL,
+                        parse_seconds REAL,
+                        db_write_seconds REAL,
+                        tokens_per_second REAL
+                    )
+                """)
+                self._add_missing_columns(cursor, 'crawl_runs', {'pacing_seconds': 'REAL'})
+                # MinHash signature of each world's owner set, rebuilt on every save
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS world_sketches (
+                        chain TEXT NOT NULL,
+                        collection TEXT NOT NULL,
+                        world TEXT NOT NULL,
+                        member_count INTEGER,
+                        signature BLOB,
+                        PRIMARY KEY (chain, collection, world)
+                    )
+                """)
+                # Names dropped by the parser, with the reason, for the latest crawl
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS rejected_names (
+                        chain TEXT,
+                        collection TEXT,
+                        refreshed_at TEXT,
+                        name TEXT,
+                        reason TEXT
                     )
                 """)
                 # Create metadata table for last_updated
@@ -61,12 +211,180 @@ class ZeroStudyResearcher:
             logger.error(f"Error initializing database: {str(e)}")
             raise
 
-    def load_saved_data(self) -> Tuple[List[Dict[str, Any]], datetime]:
-        """Load data and timestamp from SQLite database"""
+    def _migrate_schema(self, cursor: sqlite3.Cursor) -> None:
+        """Upgrade a single-collection database to (chain, collection) keyed tables.
+
+        Existing rows all belong to the original ZERO ID collection on
+        Ethereum. The owners table is derived data and is simply rebuilt.
+        The upgrade is one transaction under the write lock, so processes
+        starting together migrate once. Rows stranded in domains_legacy by
+        an interrupted migration from before that are moved over too.
+        """
+        def needs_migration():
+            domain_columns = self._table_columns(cursor, 'domains')
+            stranded = self._table_columns(cursor, 'domains_legacy')
+            return bool(stranded) or bool(domain_columns and 'chain' not in domain_columns)
+
+        if not needs_migration():
+            return
+        cursor.execute("BEGIN IMMEDIATE")
         try:
+            # Another process may have migrated while this one waited for the lock
+            if needs_migration():
+                self._migrate_legacy_tables(cursor)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _table_columns(cursor: sqlite3.Cursor, table: str) -> List[str]:
+        return [row[1] for row in cursor.execute(f"PRAGMA table_info({table})")]
+
+    @staticmethod
+    def _migrate_legacy_tables(cursor: sqlite3.Cursor) -> None:
+        def columns(table):
+            return ZeroStudyResearcher._table_columns(cursor, table)
+
+        logger.info("Migrating database to multi-collection schema")
+        legacy = (DEFAULT_CHAIN, DEFAULT_COLLECTION)
+        if not columns('domains_legacy'):
+            cursor.execute("ALTER TABLE domains RENAME TO domains_legacy")
+        cursor.execute("DROP INDEX IF EXISTS idx_domains_owner")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS domains (
+                chain TEXT NOT NULL,
+                collection TEXT NOT NULL,
+                name TEXT NOT NULL,
+                owner TEXT,
+                world TEXT,
+                root_domain TEXT,
+                domain TEXT,
+                is_subdomain BOOLEAN,
+                member_count INTEGER,
+                mint_date TEXT,
+                PRIMARY KEY (chain, collection, name)
+            )
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO domains (chain, collection, name, owner, world, root_domain,
+                                           domain, is_subdomain, member_count, mint_date)
+            SELECT ?, ?, name, owner, world, root_domain, domain, is_subdomain, member_count, mint_date
+            FROM domains_legacy
+        """, legacy)
+        cursor.execute("DROP TABLE domains_legacy")
+        cursor.execute("DROP TABLE IF EXISTS owners")
+
+        for table in ('changelog', 'crawl_runs'):
+            if columns(table) and 'chain' not in columns(table):
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN chain TEXT")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN collection TEXT")
+                cursor.execute(f"UPDATE {table} SET chain = ?, collection = ?", legacy)
+
+        cursor.execute("""
+            INSERT OR IGNORE INTO metadata (key, value)
+            SELECT ?, value FROM metadata WHERE key = 'last_updated'
+        """, (f"last_updated:{collection_key(*legacy)}",))
+
+    @staticmethod
+    def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
+        """Add columns introduced after a database was created; their values stay NULL until the next save"""
+        existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        for column, sql_type in columns.items():
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}")
+
+    def _resolve_keys(self, collections: Optional[List[str]]) -> List[Tuple[str, str]]:
+        """(chain, collection) pairs for the given keys, defaulting to this researcher's"""
+        return [parse_collection_key(key) for key in (collections or [self.collection_key])]
+
+    @staticmethod
+    def _key_filter(keys: List[Tuple[str, str]]) -> Tuple[str, List[str]]:
+        """SQL condition and parameters selecting rows for the given pairs"""
+        condition = ' OR '.join('(chain = ? AND collection = ?)' for _ in keys)
+        params = [value for key in keys for value in key]
+        return f"({condition})", params
+
+    def get_last_updated(self) -> datetime:
+        """Read only the data version timestamp, without loading any rows"""
+        try:
+            with sqlite3.connect(self.db_file) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT value FROM metadata WHERE key = 'last_updated'")
+                result = cursor.fetchone()
+                return datetime.fromisoformat(result[0]) if result else datetime(2000, 1, 1)
+        except Exception as e:
+            logger.error(f"Error reading last updated timestamp: {str(e)}")
+            return datetime(2000, 1, 1)
+
+    def get_collection_versions(self) -> Dict[str, str]:
+        """Last saved timestamp for every collection key with data"""
+        try:
+            with sqlite3.connect(self.db_file) as conn:
+                rows = conn.execute(
+                    "SELECT key, value FROM metadata WHERE key LIKE 'last_updated:%'").fetchall()
+            return {key[len('last_updated:'):]: value for key, value in rows}
+        except Exception as e:
+            logger.error(f"Error reading collection versions: {str(e)}")
+            return {}
+
+    def _read_collection(self, key: str) -> pd.DataFrame:
+        condition, params = self._key_filter(self._resolve_keys([key]))
+        with sqlite3.connect(self.db_file) as conn:
+            return pd.read_sql_query(f"SELECT * FROM domains WHERE {condition}", conn, params=params)
+
+    def _publish_snapshot(self, key: str, version: str) -> Optional[pd.DataFrame]:
+        """Publish the stored rows of key as its Arrow snapshot; never raises"""
+        try:
+            df = self._read_collection(key)
+            self.snapshots.publish(key, version, df)
+            return df
+        except Exception as e:
+            logger.warning(f"Could not publish snapshot for {key}: {str(e)}")
+            return None
+
+    def load_collection_frame(self, key: str) -> pd.DataFrame:
+        """Load one collection's domains as a DataFrame.
+
+        Uses the memory-mapped Arrow snapshot when it matches the stored
+        version, otherwise reads SQLite and republishes the snapshot. Either
+        way the frame has the snapshot's dtypes (Arrow strings, pd.NA nulls).
+        """
+        version = self.get_collection_versions().get(key)
+        snapshot = self.snapshots.load(key) if version else None
+        if snapshot is not None and snapshot[1] == version:
+            return snapshot[0]
+
+        if version and self._publish_snapshot(key, version) is not None:
+            snapshot = self.snapshots.load(key)
+            if snapshot is not None and snapshot[1] == version:
+                return snapshot[0]
+        return ArrowSnapshot.normalize(self._read_collection(key))
+
+    def load_saved_frame(self, collections: Optional[List[str]] = None) -> Tuple[pd.DataFrame, datetime]:
+        """Like load_saved_data, but returns the (snapshot-backed) DataFrame itself"""
+        try:
+            keys = [collection_key(*key) for key in self._resolve_keys(collections)]
+            frames = [self.load_collection_frame(key) for key in keys]
+            df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            last_updated = self.get_last_updated()
+            logger.info(f"Loaded {len(df)} domains from snapshot (last updated: {last_updated})")
+            return df, last_updated
+        except Exception as e:
+            logger.error(f"Error loading saved data: {str(e)}")
+            return pd.DataFrame(), datetime(2000, 1, 1)
+
+    def load_saved_data(self, collections: Optional[List[str]] = None) -> Tuple[List[Dict[str, Any]], datetime]:
+        """Load data and timestamp from SQLite database.
+
+        collections is a list of 'chain:address' keys to combine; it
+        defaults to this researcher's own collection.
+        """
+        try:
+            condition, params = self._key_filter(self._resolve_keys(collections))
             with sqlite3.connect(self.db_file) as conn:
                 # Convert SQL rows to DataFrame then to dict for consistency
-                df = pd.read_sql_query("SELECT * FROM domains", conn)
+                df = pd.read_sql_query(f"SELECT * FROM domains WHERE {condition}", conn, params=params)
                 domains_data = df.to_dict('records')
 
                 # Get last updated timestamp
@@ -81,40 +399,196 @@ class ZeroStudyResearcher:
             logger.error(f"Error loading saved data: {str(e)}")
             return [], datetime(2000, 1, 1)
 
-    def save_data(self, domains_data: List[Dict[str, Any]]) -> None:
-        """Save data with timestamp to SQLite database"""
+    @staticmethod
+    def _insert_frame(cursor: sqlite3.Cursor, table: str, df: pd.DataFrame) -> None:
+        """Bulk insert a DataFrame without committing, unlike DataFrame.to_sql"""
+        if df.empty:
+            return
+        columns = ', '.join(df.columns)
+        placeholders = ', '.join('?' for _ in df.columns)
+        cursor.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+                           df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+    def save_data(self, domains_data: List[Dict[str, Any]],
+                  rejected: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Save data with timestamp to SQLite database.
+
+        Everything is written in a single transaction so readers switch from
+        the previous snapshot to the new one atomically on commit. rejected
+        names from parse_tokens replace this collection's previous rejects.
+        Saves from parallel crawls queue on the write lock, and one that
+        still times out is retried rather than dropping the crawl.
+        """
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                # Convert to DataFrame for easier SQL insertion
-                df = pd.DataFrame(domains_data)
-
-                # Clear existing data
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM domains")
+            # Convert to DataFrame for easier SQL insertion
+            df = pd.DataFrame(domains_data)
+            df = df.assign(chain=self.chain, collection=self.contract_address)
 
-                # Insert new data
-                df.to_sql('domains', conn, if_exists='append', index=False)
+            # Derived data only depends on the new rows, so build it before taking the write lock
+            df = DomainGraph.annotate(df)
+            sketch_rows = WorldSketches.from_frame(df).to_rows()
 
-                # Update last_updated timestamp
-                now = datetime.now().isoformat()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO metadata (key, value) 
-                    VALUES ('last_updated', ?)
-                """, (now,))
-
-                conn.commit()
-                logger.info(f"Saved {len(domains_data)} domains to database")
+            for attempt in range(1, SAVE_ATTEMPTS + 1):
+                try:
+                    now = self._write_data(df, domains_data, sketch_rows, rejected)
+                    break
+                except sqlite3.OperationalError as e:
+                    if 'locked' not in str(e) or attempt == SAVE_ATTEMPTS:
+                        raise
+                    logger.warning(f"Database busy, retrying save ({attempt}/{SAVE_ATTEMPTS}): {str(e)}")
+
+            # Published from the stored rows so snapshot and SQLite reads agree on dtypes
+            self._publish_snapshot(self.collection_key, now)
         except Exception as e:
             logger.error(f"Error saving data: {str(e)}")
             raise
 
-    def get_nft_data(self, force_refresh: bool = False) -> Tuple[List[Dict[str, Any]], datetime]:
-        """Get domain data from NFT metadata using Reservoir API"""
+    def _write_data(self, df: pd.DataFrame, domains_data: List[Dict[str, Any]],
+                    sketch_rows: List[Tuple[str, int, bytes]],
+                    rejected: Optional[List[Dict[str, Any]]]) -> str:
+        """One save_data transaction; returns the new data version"""
+        with sqlite3.connect(self.db_file, timeout=DB_WRITE_TIMEOUT) as conn:
+            now = datetime.now().isoformat()
+            scope = (self.chain, self.contract_address)
+            cursor = conn.cursor()
+            # Take the write lock before reading, so a save that committed meanwhile
+            # makes this one wait instead of failing on a stale read snapshot
+            cursor.execute("BEGIN IMMEDIATE")
+
+            # Diff incoming crawl against this collection's stored snapshot before replacing it
+            cursor.execute("SELECT name, owner, member_count FROM domains WHERE chain = ? AND collection = ?",
+                           scope)
+            previous = SnapshotDiffer.build_state(cursor.fetchall())
+            if previous:
+                changes = SnapshotDiffer.diff(previous, domains_data)
+                cursor.executemany("""
+                    INSERT INTO changelog (chain, collection, refreshed_at, name, change_type, old_owner,
+                                           new_owner, old_member_count, new_member_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(*scope, now, c['name'], c['change_type'], c['old_owner'], c['new_owner'],
+                       c['old_member_count'], c['new_member_count']) for c in changes])
+                logger.info(f"Recorded {len(changes)} changes since last refresh")
+
+            # Replace this collection's rows only, with graph metrics for ranking in the app
+            cursor.execute("DELETE FROM domains WHERE chain = ? AND collection = ?", scope)
+            self._insert_frame(cursor, 'domains', df)
+
+            # Rebuild owner summaries in the same transaction, from the rows just inserted
+            cursor.execute("DELETE FROM owners WHERE chain = ? AND collection = ?", scope)
+            cursor.execute("""
+                INSERT INTO owners (chain, collection, owner, domain_count, first_mint, last_mint)
+                SELECT ?, ?, lower(owner), COUNT(*), MIN(mint_date), MAX(mint_date)
+                FROM domains
+                WHERE chain = ? AND collection = ? AND owner IS NOT NULL AND owner != 'Unknown'
+                GROUP BY lower(owner)
+            """, (*scope, *scope))
+
+            # World overlap sketches
+            cursor.execute("DELETE FROM world_sketches WHERE chain = ? AND collection = ?", scope)
+            cursor.executemany("""
+                INSERT INTO world_sketches (chain, collection, world, member_count, signature)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(*scope, *row) for row in sketch_rows])
+
+            # Keep only the latest crawl's rejected names
+            if rejected is not None:
+                cursor.execute("DELETE FROM rejected_names WHERE chain = ? AND collection = ?", scope)
+                cursor.executemany("""
+                    INSERT INTO rejected_names (chain, collection, refreshed_at, name, reason)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(*scope, now, None if r['name'] is None else str(r['name']), r['reason'])
+                      for r in rejected])
+
+            # Update the global data version and this collection's timestamp
+            cursor.executemany("""
+                INSERT OR REPLACE INTO metadata (key, value)
+                VALUES (?, ?)
+            """, [('last_updated', now), (f"last_updated:{self.collection_key}", now)])
+
+            conn.commit()
+            logger.info(f"Saved {len(domains_data)} domains for {self.collection_key} to database")
+            return now
+
+    def load_owner_index(self, collections: Optional[List[str]] = None) -> OwnerIndex:
+        """Load the owner index maintained by save_data, combined across collections.
+
+        Collections without owner rows (migrated legacy databases, imported
+        exports) are summarized from their domains on the fly.
+        """
+        try:
+            keys = self._resolve_keys(collections)
+            condition, params = self._key_filter(keys)
+            with sqlite3.connect(self.db_file) as conn:
+                present = {tuple(row) for row in conn.execute(
+                    f"SELECT DISTINCT chain, collection FROM owners WHERE {condition}", params)}
+                parts, part_params = [], []
+                if present:
+                    present_condition, present_params = self._key_filter(sorted(present))
+                    parts.append(f"SELECT owner, domain_count, first_mint, last_mint "
+                                 f"FROM owners WHERE {present_condition}")
+                    part_params += present_params
+                missing = [key for key in keys if key not in present]
+                if missing:
+                    missing_condition, missing_params = self._key_filter(missing)
+                    parts.append(f"""
+                        SELECT lower(owner) AS owner, COUNT(*) AS domain_count,
+                               MIN(mint_date) AS first_mint, MAX(mint_date) AS last_mint
+                        FROM domains
+                        WHERE owner IS NOT NULL AND owner != 'Unknown' AND {missing_condition}
+                        GROUP BY chain, collection, lower(owner)
+                    """)
+                    part_params += missing_params
+                summary = pd.read_sql_query(f"""
+                    SELECT owner, SUM(domain_count) AS domain_count,
+                           MIN(first_mint) AS first_mint, MAX(last_mint) AS last_mint
+                    FROM ({' UNION ALL '.join(parts)})
+                    GROUP BY owner
+                """, conn, params=part_params)
+                holdings_df = pd.read_sql_query(
+                    f"SELECT lower(owner) AS owner, name FROM domains "
+                    f"WHERE owner IS NOT NULL AND owner != 'Unknown' AND {condition}",
+                    conn, params=params)
+
+            holdings = OwnerIndex.group_names(holdings_df['owner'].to_numpy(dtype=object),
+                                              holdings_df['name'].to_numpy(dtype=object))[0]
+            logger.info(f"Loaded owner index with {len(holdings)} owners")
+            return OwnerIndex(holdings, summary)
+        except Exception as e:
+            logger.error(f"Error loading owner index: {str(e)}")
+            return OwnerIndex({}, pd.DataFrame(columns=OwnerIndex.SUMMARY_COLUMNS))
+
+    def load_changes(self, collections: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load changelog rows from the latest saved refresh of each collection"""
+        try:
+            versions = self.get_collection_versions()
+            frames = []
+            with sqlite3.connect(self.db_file) as conn:
+                for chain, collection in self._resolve_keys(collections):
+                    refreshed_at = versions.get(collection_key(chain, collection))
+                    if refreshed_at is None:
+                        continue
+                    frames.append(pd.read_sql_query(
+                        "SELECT * FROM changelog WHERE chain = ? AND collection = ? AND refreshed_at = ? ORDER BY id",
+                        conn, params=(chain, collection, refreshed_at)))
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Error loading changelog: {str(e)}")
+            return pd.DataFrame()
+
+    def get_nft_data(self, force_refresh: bool = False,
+                     progress_callback: Optional[Callable[[int], None]] = None) -> Tuple[List[Dict[str, Any]], datetime]:
+        """Get domain data from NFT metadata using Reservoir API.
+
+        progress_callback, if given, is called with the running token count
+        after every fetched page.
+        """
         if not force_refresh:
             saved_data, last_updated = self.load_saved_data()
             if saved_data:
                 return saved_data, last_updated
 
+        metrics = CrawlMetrics(self.chain, self.contract_address)
+        self.last_crawl_metrics = metrics
         try:
             url = f"{self.base_url}/tokens/v7"
             headers = {
@@ -128,6 +602,9 @@ class ZeroStudyResearcher:
 
             all_tokens = []
             continuation = None
+            page_digests = []
+            # The wait after a 429 is the penalty, not routine pacing
+            penalized = False
 
             # Handle pagination with rate limits
             while True:
@@ -135,17 +612,21 @@ class ZeroStudyResearcher:
                     params['continuation'] = continuation
 
                 try:
-                    logger.info(f"Fetching NFT data from Reservoir API{' with continuation' if continuation else ''}")
-                    response = requests.get(url, headers=headers, params=params)
-
-                    # Log response info
-                    logger.info(f"API Response Status: {response.status_code}")
-                    logger.info(f"API Response Headers: {dict(response.headers)}")
+                    logger.debug(f"Fetching NFT data from Reservoir API{' with continuation' if continuation else ''}")
+                    # Wait for a request slot on this host (2 requests per second, shared across processes)
+                    metrics.add_time('backoff_seconds' if penalized else 'pacing_seconds', self.rate_limiter.acquire())
+                    penalized = False
+                    with metrics.timer('fetch_seconds'):
+                        response = requests.get(url, headers=headers, params=params)
+                    metrics.increment('bytes_received', len(response.content))
+                    logger.debug(f"API Response Status: {response.status_code}")
 
                     # Handle rate limits and errors
                     if response.status_code == 429:
-                        logger.warning("Rate limit hit, waiting 60 seconds before retry...")
-                        time.sleep(60)
+                        metrics.increment('rate_limit_hits')
+                        logger.warning("Rate limit hit, pausing this host for 60 seconds before retry...")
+                        self.rate_limiter.penalize(60)
+                        penalized = True
                         continue
                     elif response.status_code == 401:
                         raise ValueError("Invalid Reservoir API key")
@@ -162,79 +643,176 @@ class ZeroStudyResearcher:
                         break
 
                     all_tokens.extend(tokens)
-                    logger.info(f"Added {len(tokens)} tokens (total: {len(all_tokens)})")
+                    page_digests.append(self._cache_page(response.content))
+                    metrics.increment('pages_fetched')
+                    metrics.increment('tokens_fetched', len(tokens))
+                    if metrics.counters['pages_fetched'] % 100 == 0:
+                        logger.info(f"Fetched {metrics.counters['pages_fetched']} pages ({len(all_tokens)} tokens)")
+                    if progress_callback:
+                        progress_callback(len(all_tokens))
 
                     continuation = data.get('continuation')
                     if not continuation:
                         break
 
-                    # Wait between requests to respect rate limits (2 requests per second)
-                    time.sleep(0.5)  # 500ms delay between requests
-
                 except requests.exceptions.RequestException as e:
+                    metrics.increment('request_errors')
                     logger.error(f"Request error: {str(e)}")
-                    time.sleep(30)
+                    self._backoff(metrics, 30)
                     continue
 
+            self._write_page_manifest(metrics, page_digests)
+
             # Process tokens into domain data
-            domains_data = []
-            domain_members = {}
+            with metrics.timer('parse_seconds'):
+                domains_data, rejected = self.parse_tokens(all_tokens)
 
-            for token in all_tokens:
-                try:
-                    token_data = token.get('token', {})
-                    name = token_data.get('name', '')
-                    if not name or not isinstance(name, str) or not name.startswith('0://'):
-                        continue
+            # Save to database
+            with metrics.timer('db_write_seconds'):
+                self.save_data(domains_data, rejected)
+            metrics.increment('domains_saved', len(domains_data))
+            metrics.finish('completed')
+            return domains_data, datetime.now()
 
-                    owner = token_data.get('owner', 'Unknown')
-                    mint_date = token_data.get('mintedAt')
+        except Exception as e:
+            metrics.finish('failed')
+            logger.error(f"Error fetching NFT data: {str(e)}")
+            return [], datetime.now()
+        finally:
+            self._save_crawl_metrics(metrics)
 
-                    domain_parts = name[4:].split('.')
-                    if not domain_parts:
-                        continue
+    def _cache_page(self, body: bytes) -> Optional[str]:
+        """Store a raw page in the page cache; caching never fails the crawl"""
+        try:
+            return self.page_cache.put(body)
+        except Exception as e:
+            logger.warning(f"Could not cache page: {str(e)}")
+            return None
 
-                    world = domain_parts[0]
-                    root_domain = '.'.join(domain_parts[:-1]) if len(domain_parts) > 1 else world
-                    domain = domain_parts[-1]
-
-                    # Track members for parent domains
-                    if len(domain_parts) > 1:
-                        parent = '.'.join(domain_parts[:-1])
-                        if parent not in domain_members:
-                            domain_members[parent] = set()
-                        domain_members[parent].add(name)
-
-                    domains_data.append({
-                        'name': name,
-                        'owner': owner,
-                        'world': world,
-                        'root_domain': root_domain,
-                        'domain': domain,
-                        'is_subdomain': len(domain_parts) > 1,
-                        'member_count': 0,  # Updated after all domains are processed
-                        'mint_date': mint_date
-                    })
-
-                except Exception as e:
-                    logger.error(f"Error processing token: {str(e)}")
-                    continue
+    def _write_page_manifest(self, metrics: CrawlMetrics, page_digests: List[Optional[str]]) -> None:
+        """Record the finished crawl's pages, unless some failed to cache"""
+        try:
+            complete = None not in page_digests
+            self.page_cache.write_manifest(
+                metrics.started_at.strftime('%Y%m%dT%H%M%S%f'),
+                [digest for digest in page_digests if digest],
+                complete=complete,
+                extra={'chain': self.chain, 'collection': self.contract_address})
+            self.page_cache.evict()
+        except Exception as e:
+            logger.warning(f"Could not write page cache manifest: {str(e)}")
+
+    def reprocess_cached_pages(self) -> Tuple[List[Dict[str, Any]], datetime]:
+        """Rebuild the domains table from the latest cached crawl, with no network calls"""
+        manifest = self.page_cache.latest_manifest(self.chain, self.contract_address)
+        if manifest is None:
+            raise ValueError(f"No complete crawl of {self.collection_key} in the page cache to reprocess")
 
-            # Update member counts
-            for domain in domains_data:
-                domain_name = domain['name'][4:]
-                member_count = len(domain_members.get(domain_name, set()))
-                domain['member_count'] = member_count
+        metrics = CrawlMetrics(self.chain, self.contract_address)
+        self.last_crawl_metrics = metrics
+        try:
+            logger.info(f"Reprocessing {len(manifest['pages'])} cached pages from crawl {manifest['run_id']}")
+            all_tokens = []
+            with metrics.timer('fetch_seconds'):
+                for page in self.page_cache.iter_pages(manifest):
+                    tokens = page.get('tokens', [])
+                    all_tokens.extend(tokens)
+                    metrics.increment('pages_fetched')
+                    metrics.increment('tokens_fetched', len(tokens))
 
-            logger.info(f"Processed {len(domains_data)} domains")
+            with metrics.timer('parse_seconds'):
+                domains_data, rejected = self.parse_tokens(all_tokens)
 
-            # Save to database
-            self.save_data(domains_data)
+            with metrics.timer('db_write_seconds'):
+                self.save_data(domains_data, rejected)
+            metrics.increment('domains_saved', len(domains_data))
+            metrics.finish('reprocessed')
             return domains_data, datetime.now()
+        except Exception:
+            metrics.finish('failed')
+            raise
+        finally:
+            self._save_crawl_metrics(metrics)
+
+    @staticmethod
+    def _backoff(metrics: CrawlMetrics, seconds: float) -> None:
+        """Sleep, counting the time against the crawl's backoff total"""
+        time.sleep(seconds)
+        metrics.add_time('backoff_seconds', seconds)
+
+    def _save_crawl_metrics(self, metrics: CrawlMetrics) -> None:
+        if metrics.status == 'running':
+            metrics.finish('interrupted')
+        try:
+            metrics.save(self.db_file)
+            logger.info(f"Crawl metrics: {metrics.to_dict()}")
+        except Exception as e:
+            logger.error(f"Error saving crawl metrics: {str(e)}")
 
+    def load_world_sketches(self, collections: Optional[List[str]] = None) -> WorldSketches:
+        """World owner-set sketches saved at refresh time, merged across collections"""
+        try:
+            keys = self._resolve_keys(collections)
+            condition, params = self._key_filter(keys)
+            with sqlite3.connect(self.db_file) as conn:
+                stored = conn.execute(
+                    f"SELECT chain, collection, world, member_count, signature FROM world_sketches WHERE {condition}",
+                    params).fetchall()
+            present = {(row[0], row[1]) for row in stored}
+            rows = [row[2:] for row in stored]
+            for key in keys:
+                if key not in present:
+                    # Saved before sketches existed or imported from an export, build them on the fly
+                    rows += WorldSketches.from_frame(self.load_collection_frame(collection_key(*key))).to_rows()
+            return WorldSketches.from_rows(rows)
         except Exception as e:
-            logger.error(f"Error fetching NFT data: {str(e)}")
-            return [], datetime.now()
+            logger.error(f"Error loading world sketches: {str(e)}")
+            return WorldSketches.from_rows([])
+
+    def load_rejected_names(self, collections: Optional[List[str]] = None) -> pd.DataFrame:
+        """Names rejected by the latest crawl of each collection"""
+        try:
+            condition, params = self._key_filter(self._resolve_keys(collections))
+            with sqlite3.connect(self.db_file) as conn:
+                return pd.read_sql_query(f"SELECT * FROM rejected_names WHERE {condition}", conn, params=params)
+        except Exception as e:
+            logger.error(f"Error loading rejected names: {str(e)}")
+            return pd.DataFrame()
+
+    def load_crawl_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return metrics for the most recent crawls, newest first"""
+        try:
+            return CrawlMetrics.load_recent(self.db_file, limit)
+        except Exception as e:
+            logger.error(f"Error loading crawl metrics: {str(e)}")
+            return []
+
+    def parse_tokens(self, all_tokens: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Turn raw /tokens/v7 entries into domain records with member counts.
+
+        Returns (records, rejected); rejected lists names that break the
+        ZNS naming rules, each with the reason it was dropped.
+        """
+        token_data = [token.get('token') or {} for token in all_tokens]
+        parsed = NameParser.parse([token.get('name') for token in token_data])
+        parsed['owner'] = [token.get('owner', 'Unknown') for token in token_data]
+        parsed['mint_date'] = [token.get('mintedAt') for token in token_data]
+
+        valid = parsed['valid'].to_numpy()
+        domains = parsed.loc[valid, ['name', 'owner', 'world', 'root_domain', 'domain',
+                                     'is_subdomain', 'member_count', 'mint_date']]
+        domains_data = domains.astype(object).where(domains.notna(), None).to_dict('records')
+        rejected = parsed.loc[~valid, ['name', 'reason']]
+        rejected = rejected.astype(object).where(rejected.notna(), None).to_dict('records')
+
+        if rejected:
+            logger.warning(f"Rejected {len(rejected)} names that break ZNS naming rules")
+        logger.info(f"Processed {len(domains_data)} domains")
+        return domains_data, rejected
+
+    def process_tokens(self, all_tokens: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Domain records for raw /tokens/v7 entries, dropping invalid names"""
+        return self.parse_tokens(all_tokens)[0]
 
     def format_output(self, domain_data: Dict[str, Any]) -> Dict[str, Any]:
         """Format domain data for better readability"""
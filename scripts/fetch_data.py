@@ -3,18 +3,78 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from research.zero_study_research import ZeroStudyResearcher
+from research.refresh_worker import RefreshWorker
+from research.collection_registry import load_collections
+import argparse
+import json
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def main():
+    parser = argparse.ArgumentParser(description="Refresh Zero domain data from Reservoir")
+    parser.add_argument('--background', action='store_true',
+                        help="launch the refresh as a detached process and return immediately")
+    parser.add_argument('--bootstrap', action='store_true',
+                        help="import the newest bundled data/ export into an empty database instead of crawling")
+    parser.add_argument('--reprocess', action='store_true',
+                        help="rebuild the domains table from cached pages without crawling")
+    parser.add_argument('--metrics', type=int, nargs='?', const=10, metavar='N',
+                        help="print telemetry for the last N crawls as JSON and exit")
+    parser.add_argument('--collection', action='append', metavar='CHAIN:ADDRESS',
+                        help="only refresh this collection key (repeatable; default: all configured)")
+    args = parser.parse_args()
+
     try:
         researcher = ZeroStudyResearcher()
-        logger.info("Fetching fresh data from Reservoir API...")
-        domains_data, last_updated = researcher.get_nft_data(force_refresh=True)
-        logger.info(f"Successfully fetched and saved {len(domains_data)} domains")
-        logger.info(f"Last updated: {last_updated}")
+        worker = RefreshWorker(researcher)
+
+        if args.metrics:
+            print(json.dumps(researcher.load_crawl_runs(args.metrics), indent=2))
+            return
+
+        collections = [key.lower() for key in args.collection] if args.collection else None
+
+        if args.background:
+            # The child runs this script again, so it gets the same mode and collections
+            if worker.launch(bootstrap=args.bootstrap, reprocess=args.reprocess, collections=collections):
+                logger.info("Background refresh started")
+            else:
+                logger.info("A refresh is already running")
+            return
+
+        if args.bootstrap:
+            if not worker.bootstrap():
+                status = worker.get_status()
+                logger.error(f"Bootstrap did not complete: {status['refresh_status']} ({status['refresh_message']})")
+                sys.exit(1)
+            logger.info(worker.get_status()['refresh_message'])
+            return
+
+        if args.reprocess:
+            logger.info("Reprocessing cached pages...")
+        else:
+            logger.info("Fetching fresh data from Reservoir API...")
+        known = {entry['key'] for entry in load_collections()}
+        for key in collections or []:
+            if key not in known:
+                logger.warning(f"{key} is not in ZNS_COLLECTIONS, refreshing it anyway")
+        completed = worker.run(reprocess=args.reprocess, collections=collections)
+
+        # Machine-readable crawl summary on stdout, one entry per collection
+        metrics = [result['metrics'] for result in worker.last_results if result['metrics']]
+        if metrics:
+            print(json.dumps(metrics, indent=2))
+
+        if not completed:
+            status = worker.get_status()
+            logger.error(f"Refresh did not complete: {status['refresh_status']} ({status['refresh_message']})")
+            sys.exit(1)
+
+        status = worker.get_status()
+        logger.info(status['refresh_message'])
+        logger.info(f"Last updated: {status['refresh_finished_at']}")
     except Exception as e:
         logger.error(f"Error fetching data: {str(e)}")
         raise
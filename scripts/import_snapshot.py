@@ -0,0 +1,41 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from research.zero_study_research import ZeroStudyResearcher
+from research.snapshot_importer import SnapshotImporter
+from research.collection_registry import DEFAULT_CHAIN, DEFAULT_COLLECTION, parse_collection_key
+import argparse
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description="Load exported JSON snapshots into the database")
+    parser.add_argument('paths', nargs='*', metavar='PATH',
+                        help="JSON exports to merge, earlier files win (default: the newest bundled data/ export)")
+    parser.add_argument('--collection', metavar='CHAIN:ADDRESS',
+                        help="collection key the records belong to (default: ZERO ID on Ethereum)")
+    parser.add_argument('--replace', action='store_true',
+                        help="replace the collection's existing rows instead of skipping a populated collection")
+    args = parser.parse_args()
+
+    try:
+        chain, collection = (parse_collection_key(args.collection.lower()) if args.collection
+                             else (DEFAULT_CHAIN, DEFAULT_COLLECTION))
+        importer = SnapshotImporter(ZeroStudyResearcher(chain=chain, collection=collection))
+
+        if args.paths:
+            importer.import_files(args.paths, replace=args.replace)
+        elif not importer.bootstrap_paths():
+            logger.error("No snapshot files to import")
+            sys.exit(1)
+        else:
+            importer.bootstrap(replace=args.replace)
+    except Exception as e:
+        logger.error(f"Error importing snapshots: {str(e)}")
+        raise
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,32 @@
-from web3 import Web3
+from web3 import Web3, AsyncWeb3
+import aiohttp
+import asyncio
 import os
 import logging
+import time
+from typing import List, Dict, Any, Optional
+from utils.contract_cache import ContractReadCache, default_cache
 
 logger = logging.getLogger(__name__)
 
+PROVIDER_URI = os.getenv('WEB3_PROVIDER_URI', 'http://localhost:8545')
+
+# Mainnet produces a block every 12 seconds; reuse the head block number that long
+BLOCK_TTL = 12
+
 class ContractHelper:
-    def __init__(self):
+    def __init__(self, cache: Optional[ContractReadCache] = None, max_concurrency: int = 16):
         # Connect to an Ethereum node (using environment variables)
-        self.w3 = Web3(Web3.HTTPProvider(os.getenv('WEB3_PROVIDER_URI', 'http://localhost:8545')))
+        self.w3 = Web3(Web3.HTTPProvider(PROVIDER_URI))
+
+        # Reads are cached per block; async lookups run at most max_concurrency at once
+        self.cache = cache or default_cache
+        self.max_concurrency = max_concurrency
+        self._block = None
+        self._async_w3 = None
+        self._async_registry = None
+        self._async_loop = None
+        self._async_session = None
 
         # Contract addresses loaded from environment
         self.contracts = {
@@ -34,12 +53,41 @@ class ContractHelper:
             logger.error(f"Failed to initialize contracts: {str(e)}")
             raise
 
-    def get_domains_data(self):
+    def current_block(self) -> int:
+        """Head block number, refreshed at most once per BLOCK_TTL"""
+        now = time.monotonic()
+        if self._block is None or now - self._block[1] > BLOCK_TTL:
+            self._block = (self.w3.eth.block_number, now)
+        return self._block[0]
+
+    def _read(self, method: str, *args, block: int) -> Any:
+        """Registry read through the block-keyed cache"""
+        key = (self.contracts['registry'], method, args, block)
+        found, value = self.cache.get(key)
+        if not found:
+            value = getattr(self.registry.functions, method)(*args).call(block_identifier=block)
+            self.cache.set(key, value)
+        return value
+
+    @staticmethod
+    def _domain_record(domain: str, owner: str, members: int,
+                       payment_amount: int, payment_type: int) -> Dict[str, Any]:
+        return {
+            'domain': domain,
+            'owner': owner,
+            'members': members,
+            'payment_amount': Web3.from_wei(payment_amount, 'ether'),
+            'payment_type': 'STAKE' if payment_type == 1 else 'DIRECT'
+        }
+
+    def get_domains_data(self, block_identifier: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Fetch domain data from smart contract with proper error handling
+        Fetch domain data from smart contract with proper error handling.
+        All reads are pinned to one block (the cached head by default).
         """
         try:
-            domains = self.registry.functions.getAllDomains().call()
+            block = block_identifier if block_identifier is not None else self.current_block()
+            domains = self._read('getAllDomains', block=block)
             domain_data = []
 
             for domain in domains:
@@ -47,21 +95,13 @@ class ContractHelper:
                     # Get domain hash
                     domain_hash = Web3.keccak(text=domain)
 
-                    data = {
-                        'domain': domain,
-                        'owner': self.registry.functions.owner(domain_hash).call(),
-                        'members': self.registry.functions.memberCount(domain).call(),
-                        'payment_amount': self.w3.from_wei(
-                            self.registry.functions.getPaymentAmount(domain).call(), 
-                            'ether'
-                        ),
-                        'payment_type': (
-                            'STAKE' 
-                            if self.registry.functions.getPaymentType(domain).call() == 1 
-                            else 'DIRECT'
-                        )
-                    }
-                    domain_data.append(data)
+                    domain_data.append(self._domain_record(
+                        domain,
+                        self._read('owner', domain_hash, block=block),
+                        self._read('memberCount', domain, block=block),
+                        self._read('getPaymentAmount', domain, block=block),
+                        self._read('getPaymentType', domain, block=block)
+                    ))
                     logger.info(f"Successfully fetched data for domain: {domain}")
                 except Exception as e:
                     logger.error(f"Error processing domain {domain}: {str(e)}")
@@ -71,4 +111,77 @@ class ContractHelper:
 
         except Exception as e:
             logger.error(f"Error fetching domain data: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def _async_contract(self):
+        """Async registry contract on a pooled aiohttp session for the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_registry is None or self._async_loop is not loop:
+            # A session is bound to the loop that opened it, so release the previous loop's pool
+            try:
+                await self.close()
+            except Exception as e:
+                logger.warning(f"Could not close previous aiohttp session: {str(e)}")
+            provider = AsyncWeb3.AsyncHTTPProvider(PROVIDER_URI)
+            # One keep-alive pool per loop, sized to the fan-out
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_concurrency))
+            await provider.cache_async_session(session)
+            self._async_session = session
+            self._async_w3 = AsyncWeb3(provider)
+            self._async_registry = self._async_w3.eth.contract(
+                address=Web3.to_checksum_address(self.contracts['registry']),
+                abi=self.registry_abi
+            )
+            self._async_loop = loop
+        return self._async_registry
+
+    async def close(self):
+        """Close the pooled aiohttp session; the next async call opens a new one"""
+        session = self._async_session
+        self._async_session = self._async_w3 = self._async_registry = self._async_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self) -> 'ContractHelper':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def current_block_async(self) -> int:
+        await self._async_contract()
+        now = time.monotonic()
+        if self._block is None or now - self._block[1] > BLOCK_TTL:
+            self._block = (await self._async_w3.eth.block_number, now)
+        return self._block[0]
+
+    async def _read_async(self, method: str, *args, block: int) -> Any:
+        key = (self.contracts['registry'], method, args, block)
+        found, value = self.cache.get(key)
+        if not found:
+            registry = await self._async_contract()
+            value = await getattr(registry.functions, method)(*args).call(block_identifier=block)
+            self.cache.set(key, value)
+        return value
+
+    async def get_domains_data_async(self, block_identifier: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Async get_domains_data: per-domain lookups fan out, max_concurrency at a time"""
+        block = block_identifier if block_identifier is not None else await self.current_block_async()
+        domains = await self._read_async('getAllDomains', block=block)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(domain):
+            async with semaphore:
+                try:
+                    owner, members, payment_amount, payment_type = await asyncio.gather(
+                        self._read_async('owner', Web3.keccak(text=domain), block=block),
+                        self._read_async('memberCount', domain, block=block),
+                        self._read_async('getPaymentAmount', domain, block=block),
+                        self._read_async('getPaymentType', domain, block=block))
+                    return self._domain_record(domain, owner, members, payment_amount, payment_type)
+                except Exception as e:
+                    logger.error(f"Error processing domain {domain}: {str(e)}")
+                    return None
+
+        results = await asyncio.gather(*(fetch(domain) for domain in domains))
+        return [record for record in results if record is not None]
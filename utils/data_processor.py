@@ -1,75 +1,164 @@
 import pandas as pd
-import math
 import numpy as np
+from typing import Dict, Sequence, Tuple
+
+# FNV-1a 64-bit prime and a murmur3 finalizer constant for the string hashes below
+_HASH_PRIME = np.uint64(0x100000001b3)
+_MIX_CONSTANT = np.uint64(0xff51afd7ed558ccd)
+_DOT = ord('.')
+
+
+def _flatten(strings: Sequence[str]) -> Tuple[bytes, np.ndarray, np.ndarray, np.ndarray]:
+    """Pack strings into one UTF-8 buffer, returning it with per-string byte bounds"""
+    joined = '\x00'.join(strings).encode('utf-8')
+    data = np.frombuffer(joined, dtype=np.uint8)
+    separators = np.flatnonzero(data == 0)
+
+    starts = np.empty(len(strings), dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = separators + 1
+    ends = np.empty(len(strings), dtype=np.int64)
+    ends[:-1] = separators
+    ends[-1] = len(data)
+    return joined, data, starts, ends
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    h ^= h >> np.uint64(33)
+    h *= _MIX_CONSTANT
+    h ^= h >> np.uint64(33)
+    return h
+
+
+def _suffix_hash_table(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Prefix sums of byte * prime**(distance to end of its string).
+
+    Weighting by distance from the end means the hash of any suffix
+    [s, end) is table[end] - table[s], whatever precedes it.
+    """
+    lengths = ends - starts
+    distance = np.repeat((ends - 1).astype(np.int32), lengths + 1)[:len(data)]
+    distance -= np.arange(len(data), dtype=np.int32)
+    powers = np.cumprod(np.full(int(lengths.max()) + 1, _HASH_PRIME, dtype=np.uint64))
+
+    # Separators sit at distance -1 and index the last power, but their byte is 0
+    weighted = data * powers[distance]
+    table = np.zeros(len(data) + 1, dtype=np.uint64)
+    np.cumsum(weighted, out=table[1:])
+    return table
+
+
+def stable_hash(strings: Sequence[str]) -> np.ndarray:
+    """Deterministic 64-bit string hashes (Python's hash() is salted per process)"""
+    if len(strings) == 0:
+        return np.empty(0, dtype=np.uint64)
+    _, data, starts, ends = _flatten(list(strings))
+    table = _suffix_hash_table(data, starts, ends)
+    return _mix(table[ends] - table[starts])
+
 
 class DataProcessor:
     def __init__(self, data):
         self.df = pd.DataFrame(data)
 
-    def apply_filters(self, min_members=0, max_members=None, 
-                     min_payment=0, max_payment=None, 
+    def apply_filters(self, min_members=0, max_members=None,
+                     min_payment=0, max_payment=None,
                      payment_types=None):
-        """Apply filters to the dataset"""
-        filtered_df = self.df.copy()
+        """Apply filters to the dataset as a single combined mask"""
+        df = self.df
 
         # Member count filter
-        filtered_df = filtered_df[filtered_df['members'] >= min_members]
+        mask = (df['members'] >= min_members).to_numpy(copy=True)
         if max_members:
-            filtered_df = filtered_df[filtered_df['members'] <= max_members]
+            mask &= (df['members'] <= max_members).to_numpy()
 
         # Payment amount filter
-        filtered_df = filtered_df[filtered_df['payment_amount'] >= min_payment]
+        mask &= (df['payment_amount'] >= min_payment).to_numpy()
         if max_payment:
-            filtered_df = filtered_df[filtered_df['payment_amount'] <= max_payment]
+            mask &= (df['payment_amount'] <= max_payment).to_numpy()
 
         # Payment type filter
         if payment_types:
-            filtered_df = filtered_df[filtered_df['payment_type'].isin(payment_types)]
-
-        return filtered_df
+            mask &= df['payment_type'].isin(payment_types).to_numpy()
+
+        return df[mask]
+
+    @staticmethod
+    def split_domains(subdomains: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Vectorized split of dotted names into base domain and subdomain flag.
+
+        The base domain is the last two labels ('a.b.c' -> 'b.c'); names
+        with more than two labels are subdomains. Also returns a stable hash
+        of each full name and integer codes for the base domains in order
+        of first appearance.
+        """
+        subdomains = list(subdomains)
+        n = len(subdomains)
+        if n == 0:
+            return {
+                'base_domain': np.empty(0, dtype=object),
+                'base_code': np.empty(0, dtype=np.int64),
+                'is_subdomain': np.empty(0, dtype=bool),
+                'name_hash': np.empty(0, dtype=np.uint64),
+            }
+
+        joined, data, starts, ends = _flatten(subdomains)
+
+        # Count dots per name and find where the last two labels begin
+        dots = np.flatnonzero(data == _DOT)
+        dot_counts = np.diff(np.searchsorted(dots, starts), append=len(dots))
+        has_base_split = dot_counts >= 2
+        base_starts = starts.copy()
+        base_starts[has_base_split] = dots[np.cumsum(dot_counts)[has_base_split] - 2] + 1
+
+        table = _suffix_hash_table(data, starts, ends)
+        name_hash = _mix(table[ends] - table[starts])
+        base_hash = _mix(table[ends] - table[base_starts])
+
+        # Group on the base hash, then decode only one string per base domain
+        base_code, unique_hashes = pd.factorize(base_hash)
+        first_seen = np.empty(len(unique_hashes), dtype=np.int64)
+        first_seen[base_code[::-1]] = np.arange(n - 1, -1, -1)
+        unique_bases = np.array([joined[s:e].decode('utf-8') for s, e in
+                                 zip(base_starts[first_seen].tolist(), ends[first_seen].tolist())],
+                                dtype=object)
+
+        return {
+            'base_domain': unique_bases[base_code],
+            'base_code': base_code,
+            'is_subdomain': has_base_split,
+            'name_hash': name_hash,
+        }
+
+    @staticmethod
+    def compute_positions(subdomains: Sequence[str], members) -> Dict[str, np.ndarray]:
+        """Batch radial layout: base domains spread evenly around the circle,
+        subdomains pushed outward by member count with a small stable angular
+        jitter so siblings do not overlap.
+        """
+        parts = DataProcessor.split_domains(subdomains)
+        members = np.asarray(members, dtype=float)
+        n_bases = max(int(parts['base_code'].max()) + 1, 1) if len(members) else 1
+
+        base_angle = 2 * np.pi * parts['base_code'] / n_bases
+        jitter = 0.2 * ((parts['name_hash'] % np.uint64(10)).astype(np.int64) - 5) / 10
+
+        is_subdomain = parts['is_subdomain']
+        # Subdomains farther out based on members, primary domains closer to center
+        radius = np.where(is_subdomain, 300 + members * 2, 200 + members)
+        angle = np.where(is_subdomain, base_angle + jitter, base_angle)
+
+        return {
+            'base_domain': parts['base_domain'],
+            'is_subdomain': is_subdomain,
+            'x': radius * np.cos(angle),
+            'y': radius * np.sin(angle),
+        }
 
     def calculate_positions(self, df):
         """Calculate radial layout positions with hierarchical structure"""
-        def get_base_domain(domain):
-            return '.'.join(domain.split('.')[-2:])
-
-        def is_subdomain(domain):
-            parts = domain.split('.')
-            return len(parts) > 2
-
-        # Add domain type and base domain columns
-        df = df.copy()
-        df['base_domain'] = df['subdomain'].apply(get_base_domain)
-        df['is_subdomain'] = df['subdomain'].apply(is_subdomain)
-
-        # Calculate positions
-        positions = []
-        domain_angles = {}
-        base_domains = df['base_domain'].unique()
-
-        # First, position primary domains
-        for i, domain in enumerate(base_domains):
-            angle = 2 * math.pi * (i / len(base_domains))
-            domain_angles[domain] = angle
-
-        for i, row in df.iterrows():
-            base_angle = domain_angles[row['base_domain']]
-
-            if row['is_subdomain']:
-                # Subdomains: larger radius based on member count
-                radius = 300 + (row['members'] * 2)  # Farther out based on members
-                # Add small variation to angle for subdomains
-                angle = base_angle + 0.2 * (hash(row['subdomain']) % 10 - 5) / 10
-            else:
-                # Primary domains: smaller base radius
-                radius = 200 + (row['members'])  # Closer to center
-                angle = base_angle
-
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            positions.append((x, y))
-
-        df['x'] = [pos[0] for pos in positions]
-        df['y'] = [pos[1] for pos in positions]
-
-        return df
\ No newline at end of file
+        positions = self.compute_positions(df['subdomain'].tolist(), df['members'].to_numpy())
+        return df.assign(base_domain=positions['base_domain'],
+                         is_subdomain=positions['is_subdomain'],
+                         x=positions['x'],
+                         y=positions['y'])
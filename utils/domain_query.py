@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+from utils.owner_index import OwnerIndex
+from utils.name_parser import NAME_PREFIX
+
+
+def normalize_name(name: str) -> str:
+    """Accept names with or without the 0:// scheme"""
+    name = name.strip().lower()
+    return name if name.startswith(NAME_PREFIX) else f"{NAME_PREFIX}{name}"
+
+
+class DomainQuery:
+    """Read-only lookups over one collection snapshot.
+
+    Rows are sorted by name once, so point lookups, world subtrees and
+    keyset pagination are binary searches over the name column. A page
+    cursor is simply the last name returned.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        df = df.sort_values('name', key=lambda names: names.str.lower(), kind='stable', ignore_index=True)
+        self.df = df.astype(object).where(df.notna(), None)
+        self.names = df['name'].str.lower().to_numpy(dtype=object)
+        self.owner_index = OwnerIndex.from_frame(df)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def _records(self, positions) -> List[Dict[str, Any]]:
+        rows = self.df.iloc[positions]
+        # NaN is not valid JSON (e.g. graph metrics on rows saved before they existed)
+        return rows.astype(object).where(rows.notna(), None).to_dict('records')
+
+    def _page(self, positions: np.ndarray, limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Rows at the first `limit` positions plus the cursor for the next page"""
+        page = positions[:limit]
+        records = self._records(page)
+        next_cursor = records[-1]['name'] if len(positions) > limit else None
+        return records, next_cursor
+
+    def _range(self, low: str, high: str) -> np.ndarray:
+        """Positions of names in [low, high)"""
+        start = np.searchsorted(self.names, low, side='left')
+        stop = np.searchsorted(self.names, high, side='left')
+        return np.arange(start, stop)
+
+    def _after(self, positions: np.ndarray, after: Optional[str]) -> np.ndarray:
+        if not after:
+            return positions
+        return positions[self.names[positions] > after.lower()] if len(positions) else positions
+
+    def get_domain(self, name: str) -> Optional[Dict[str, Any]]:
+        name = normalize_name(name)
+        position = np.searchsorted(self.names, name)
+        if position < len(self.names) and self.names[position] == name:
+            return self._records([position])[0]
+        return None
+
+    def world_subtree(self, world: str, after: Optional[str] = None,
+                      limit: int = 100) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """The world itself and every name beneath it, in name order"""
+        root = normalize_name(world)
+        # '.' sorts just before '/', so this range holds exactly root and root.*
+        positions = np.concatenate([self._range(root, root + '\x00'),
+                                    self._range(root + '.', root + '/')])
+        return self._page(self._after(positions, after), limit)
+
+    def owner_holdings(self, owner: str, after: Optional[str] = None,
+                       limit: int = 100) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], Optional[str]]:
+        """Summary and paginated domains for an address"""
+        summary = self.owner_index.get_summary(owner)
+        if summary is None:
+            return None, [], None
+        held = np.array(sorted(name.lower() for name in self.owner_index.get_domains(owner)), dtype=object)
+        positions = np.searchsorted(self.names, held)
+        records, next_cursor = self._page(self._after(positions, after), limit)
+        return summary, records, next_cursor
+
+    def search(self, term: str, after: Optional[str] = None,
+               limit: int = 100) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Case-insensitive substring match on name, world or domain"""
+        start = np.searchsorted(self.names, after.lower(), side='right') if after else 0
+        tail = self.df.iloc[start:]
+        mask = (tail['name'].str.contains(term, case=False, regex=False, na=False)
+                | tail['world'].str.contains(term, case=False, regex=False, na=False)
+                | tail['domain'].str.contains(term, case=False, regex=False, na=False))
+        return self._page(start + np.flatnonzero(mask.to_numpy()), limit)
+
+    def top_domains(self, n: int = 25) -> List[Dict[str, Any]]:
+        """Domains with the most members"""
+        members = pd.to_numeric(self.df['member_count'], errors='coerce').fillna(0).to_numpy()
+        order = np.argsort(-members, kind='stable')[:n]
+        return self._records(order)
+
+    def top_owners(self, n: int = 25) -> List[Dict[str, Any]]:
+        """Addresses holding the most domains"""
+        top = self.owner_index.top_holders(n)
+        return top.astype(object).where(top.notna(), None).to_dict('records')
@@ -0,0 +1,69 @@
+import gzip
+import json
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.shared_cache import SharedCache
+from utils.visualization import Visualizer
+
+# Default view parameters, shared by app.py and the refresh-time warm-up
+DEFAULT_MIN_MEMBERS = 20
+GROWTH_CANDIDATES = 10
+DEFAULT_GROWTH_DOMAINS = 5
+
+
+def growth_candidates(df: pd.DataFrame) -> List[str]:
+    """Domains offered in the member growth picker, busiest first"""
+    return df.nlargest(GROWTH_CANDIDATES, 'member_count')['name'].tolist()
+
+
+class FigureCache:
+    """Serialized Plotly figures in the shared cache, keyed by (data version, figure type, parameters).
+
+    Figures are stored as Plotly JSON (gzipped by default), so every app
+    process and the refresh worker share one copy and a refresh
+    invalidates them with everything else in the shared cache.
+    """
+
+    NAMESPACE = 'figure'
+
+    def __init__(self, shared_cache: SharedCache, compress: bool = True):
+        self.shared_cache = shared_cache
+        self.compress = compress
+
+    def _dumps(self, fig: go.Figure) -> bytes:
+        payload = fig.to_json().encode('utf-8')
+        return gzip.compress(payload, compresslevel=6) if self.compress else payload
+
+    def _loads(self, payload: bytes) -> go.Figure:
+        if self.compress:
+            payload = gzip.decompress(payload)
+        # Stored figures were validated when built; re-validating costs more than building small ones
+        return go.Figure(json.loads(payload), _validate=False)
+
+    def get_or_build(self, version: str, figure_type: str, params: Dict[str, Any],
+                     build: Callable[[], go.Figure]) -> go.Figure:
+        """Cached figure for these inputs, building and storing it on a miss"""
+        return self.shared_cache.get_or_compute(
+            self.NAMESPACE, SharedCache.make_key(figure_type, params), version, build,
+            dumps=self._dumps, loads=self._loads)
+
+    def warm_default_views(self, version: str, collections: List[str], df: pd.DataFrame) -> int:
+        """Pre-render the figures a fresh page load shows; returns how many were built"""
+        candidates = growth_candidates(df)[:DEFAULT_GROWTH_DOMAINS]
+        views = [
+            ('network_graph', {'collections': collections, 'min_members': DEFAULT_MIN_MEMBERS, 'search': ''},
+             lambda: Visualizer.create_network_graph(df, min_members=DEFAULT_MIN_MEMBERS)),
+            ('member_growth', {'collections': collections, 'domains': candidates, 'search': ''},
+             lambda: Visualizer.create_member_growth_chart(df.copy(), candidates)),
+        ]
+
+        built = []
+        for figure_type, params, build in views:
+            def tracked_build(build=build, figure_type=figure_type):
+                built.append(figure_type)
+                return build()
+            self.get_or_build(version, figure_type, params, tracked_build)
+        return len(built)
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Sequence, Any
+
+NAME_PREFIX = '0://'
+
+# ZNS labels are lowercase alphanumerics and hyphens, joined by dots
+VALID_BODY = r'^[a-z0-9-]+(\.[a-z0-9-]+)*$'
+
+REASON_NOT_A_STRING = 'not_a_string'
+REASON_MISSING_PREFIX = 'missing_prefix'
+REASON_EMPTY_LABEL = 'empty_label'
+REASON_INVALID_CHARACTERS = 'invalid_characters'
+
+
+def _reason(name: Any) -> str:
+    """Why a single name failed validation (only called for rejected names)"""
+    if not isinstance(name, str):
+        return REASON_NOT_A_STRING
+    if not name.startswith(NAME_PREFIX):
+        return REASON_MISSING_PREFIX
+    if '' in name[len(NAME_PREFIX):].split('.'):
+        return REASON_EMPTY_LABEL
+    return REASON_INVALID_CHARACTERS
+
+
+class NameParser:
+    """Batch decomposition and validation of raw 0:// names.
+
+    Everything runs as Arrow compute kernels over the whole batch, so
+    parsing cost does not depend on Python per-name work. For 'a.b.c':
+    world 'a', root_domain 'a.b' (the parent path), domain 'c' (the leaf)
+    and depth 2. Top-level names are their own world and root_domain.
+    """
+
+    COLUMNS = ['name', 'world', 'root_domain', 'domain', 'depth', 'is_subdomain',
+               'member_count', 'valid', 'reason']
+
+    @staticmethod
+    def parse(raw_names: Sequence[Any]) -> pd.DataFrame:
+        """Parse names into one row per input, in input order.
+
+        member_count is the number of distinct valid names directly under
+        each name. Invalid rows keep their raw name with valid=False and a
+        reason; their other columns are empty.
+        """
+        raw_names = list(raw_names)
+        names = pa.array([name if isinstance(name, str) else None for name in raw_names], type=pa.string())
+
+        body = pc.utf8_slice_codeunits(names, len(NAME_PREFIX))
+        valid = pc.fill_null(pc.and_(pc.starts_with(names, NAME_PREFIX),
+                                     pc.match_substring_regex(body, VALID_BODY)), False)
+        valid_np = valid.to_numpy(zero_copy_only=False)
+        body = pc.if_else(valid, body, pa.scalar(None, pa.string()))
+
+        # Splitting once from each end is much cheaper than regex replaces
+        world = pc.list_element(pc.split_pattern(body, '.', max_splits=1), 0)
+        tail_split = pc.split_pattern(body, '.', max_splits=1, reverse=True)
+        root_domain = pc.list_element(tail_split, 0)
+        # The leaf is the last element of each split list; invalid rows take a null index
+        last_part = pa.array(tail_split.offsets.to_numpy()[1:] - 1, mask=~valid_np)
+        domain = pc.take(pc.list_flatten(tail_split), last_part)
+        depth = pc.count_substring(body, '.')
+
+        # Members: distinct subdomain names grouped by their parent path
+        is_subdomain = pc.fill_null(pc.greater(depth, 0), False)
+        first_seen = ~pd.Series(names.to_numpy(zero_copy_only=False)).duplicated().to_numpy()
+        member_of = pc.filter(root_domain, pc.and_(is_subdomain, pa.array(first_seen)))
+        counts = pc.value_counts(member_of)
+        member_count = pc.fill_null(
+            pc.take(counts.field('counts'), pc.index_in(body, value_set=counts.field('values'))), 0)
+
+        reason = np.full(len(raw_names), None, dtype=object)
+        for position in np.flatnonzero(~valid_np):
+            reason[position] = _reason(raw_names[position])
+
+        return pd.DataFrame({
+            'name': pd.Series(raw_names, dtype=object),
+            'world': world.to_pandas(),
+            'root_domain': root_domain.to_pandas(),
+            'domain': domain.to_pandas(),
+            'depth': depth.to_pandas().astype('Int64'),
+            'is_subdomain': is_subdomain.to_numpy(zero_copy_only=False),
+            'member_count': member_count.to_numpy(zero_copy_only=False).astype(np.int64),
+            'valid': valid_np,
+            'reason': reason,
+        }, columns=NameParser.COLUMNS)
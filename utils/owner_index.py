@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+
+
+class OwnerIndex:
+    """Owner -> domain lookup table built once per data refresh"""
+
+    SUMMARY_COLUMNS = ['owner', 'domain_count', 'first_mint', 'last_mint']
+
+    def __init__(self, holdings: Dict[str, List[str]], summary: pd.DataFrame):
+        # holdings maps lowercased owner address -> list of domain names
+        self.holdings = holdings
+        self.summary = summary.set_index('owner', drop=False) if not summary.empty else summary
+
+    @staticmethod
+    def group_names(owners: np.ndarray, names: np.ndarray) -> Tuple[Dict[str, List[str]], np.ndarray, np.ndarray]:
+        """Group names by owner with one sort instead of a per-group aggregation.
+
+        Returns (holdings, order, starts): order sorts the inputs by owner
+        (first-appearance order) and starts are the group boundaries in it.
+        """
+        codes, uniques = pd.factorize(owners)
+        order = np.argsort(codes, kind='stable')
+        starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+        groups = np.split(np.asarray(names, dtype=object)[order], starts[1:])
+        return dict(zip(uniques, (group.tolist() for group in groups))), order, starts
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'OwnerIndex':
+        """Build the index from a domains DataFrame with vectorized grouping"""
+        if df.empty or 'owner' not in df.columns:
+            return cls({}, pd.DataFrame(columns=cls.SUMMARY_COLUMNS))
+
+        owned = df[df['owner'].notna() & (df['owner'] != 'Unknown')]
+        if owned.empty:
+            return cls({}, pd.DataFrame(columns=cls.SUMMARY_COLUMNS))
+        owners = owned['owner'].str.lower().to_numpy(dtype=object)
+        holdings, order, starts = cls.group_names(owners, owned['name'].to_numpy(dtype=object))
+
+        # ISO mint dates sort as strings, so rank them once and take min/max over integer codes
+        if 'mint_date' in owned.columns:
+            mint_codes, mint_values = pd.factorize(owned['mint_date'], sort=True)
+        else:
+            mint_codes, mint_values = np.full(len(owned), -1), np.empty(0, dtype=object)
+        mint_codes = mint_codes[order]
+        # Code -1 (missing) and len(mint_values) both land on the trailing None
+        lookup = np.append(np.asarray(mint_values, dtype=object), None)
+        first = np.minimum.reduceat(np.where(mint_codes < 0, len(mint_values), mint_codes), starts)
+        last = np.maximum.reduceat(mint_codes, starts)
+
+        summary = pd.DataFrame({
+            'owner': list(holdings),
+            'domain_count': np.diff(np.append(starts, len(order))),
+            'first_mint': lookup[first],
+            'last_mint': lookup[last],
+        })
+        return cls(holdings, summary)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'OwnerIndex':
+        """Build the index from domain records as returned by load_saved_data"""
+        return cls.from_frame(pd.DataFrame(records))
+
+    def __len__(self) -> int:
+        return len(self.holdings)
+
+    def __contains__(self, owner: str) -> bool:
+        return owner.lower() in self.holdings
+
+    def get_domains(self, owner: str) -> List[str]:
+        """Return the domain names held by an address (constant time)"""
+        return self.holdings.get(owner.lower(), [])
+
+    def get_summary(self, owner: str) -> Optional[Dict[str, Any]]:
+        """Return domain count and earliest/latest mint for an address"""
+        owner = owner.lower()
+        if owner not in self.holdings or self.summary.empty or owner not in self.summary.index:
+            return None
+        return self.summary.loc[owner].to_dict()
+
+    def top_holders(self, n: int = 50) -> pd.DataFrame:
+        """Return the n addresses holding the most domains"""
+        if self.summary.empty:
+            return self.summary
+        return (self.summary
+                .sort_values(['domain_count', 'first_mint'], ascending=[False, True])
+                .head(n)
+                .reset_index(drop=True))
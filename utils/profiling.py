@@ -0,0 +1,89 @@
+import os
+import time
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+# Opt-in: set ZNS_PROFILE=1 to time app phases and Visualizer/DataExporter calls
+PROFILING_ENABLED = os.getenv('ZNS_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+_DISABLED_PHASE = nullcontext()
+
+
+class PhaseProfiler:
+    """Rolling per-phase timing samples kept in process memory"""
+
+    def __init__(self, enabled: bool = False, window: int = 500):
+        self.enabled = enabled
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(phase)
+            if samples is None:
+                samples = self._samples[phase] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def phase(self, name: str):
+        """Context manager timing the enclosed block; a no-op when disabled"""
+        if not self.enabled:
+            return _DISABLED_PHASE
+        return self._timed(name)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """p50/p95/max in milliseconds for every recorded phase"""
+        with self._lock:
+            snapshot = {phase: np.fromiter(samples, dtype=float) for phase, samples in self._samples.items()}
+
+        rows = []
+        for phase, samples in sorted(snapshot.items()):
+            p50, p95 = np.percentile(samples, [50, 95]) * 1000
+            rows.append({
+                'phase': phase,
+                'calls': len(samples),
+                'p50_ms': round(float(p50), 2),
+                'p95_ms': round(float(p95), 2),
+                'max_ms': round(float(samples.max()) * 1000, 2)
+            })
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+profiler = PhaseProfiler(enabled=PROFILING_ENABLED)
+
+
+def profiled(name: Optional[str] = None):
+    """Decorator timing every call under the given phase name.
+
+    When profiling is disabled the function is returned unwrapped, so
+    decorated code pays nothing at call time.
+    """
+    def decorator(func):
+        if not profiler.enabled:
+            return func
+
+        phase_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profiler._timed(phase_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
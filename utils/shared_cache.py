@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.getenv('ZNS_SHARED_CACHE_MB', '512')) * 1024 * 1024
+
+# Lives next to the main database
+SHARED_CACHE_FILE = 'shared_cache.db'
+
+# Recency is only written back this often, so hot reads stay read-only
+TOUCH_INTERVAL = 60
+
+
+class SharedCache:
+    """Local cache shared by every app process, stored in its own SQLite file.
+
+    Entries are (namespace, key) -> bytes, each tagged with the data
+    version (last_updated) it was computed from. Reads only match the
+    requested version, and invalidate() deletes every other version in
+    one transaction, so a refresh switches all workers to new entries at
+    once. Eviction drops the least recently read entries beyond max_bytes.
+    """
+
+    def __init__(self, db_file: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_file = db_file
+        self.max_bytes = max_bytes
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    value BLOB,
+                    size INTEGER,
+                    accessed_at REAL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed_at ON cache_entries (accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_file, timeout=30)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stable key for arbitrary JSON-serializable parameters"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, namespace: str, key: str, version: str) -> Optional[bytes]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute("""
+                    SELECT value, accessed_at FROM cache_entries
+                    WHERE namespace = ? AND key = ? AND version = ?
+                """, (namespace, key, version)).fetchone()
+                if row is None:
+                    return None
+                now = time.time()
+                if now - row[1] > TOUCH_INTERVAL:
+                    conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                                 (now, namespace, key))
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache read failed: {str(e)}")
+            return None
+
+    def put(self, namespace: str, key: str, version: str, value: bytes) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO cache_entries (namespace, key, version, value, size, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (namespace, key, version, value, len(value), time.time()))
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write failed: {str(e)}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        for namespace, key, size in conn.execute(
+                "SELECT namespace, key, size FROM cache_entries ORDER BY accessed_at").fetchall():
+            if total - freed <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key))
+            freed += size
+
+    def get_or_compute(self, namespace: str, key: str, version: str, compute: Callable[[], Any],
+                       dumps: Callable[[Any], bytes] = pickle.dumps,
+                       loads: Callable[[bytes], Any] = pickle.loads) -> Any:
+        """Cached value for (namespace, key) at version, computing and storing it on a miss"""
+        payload = self.get(namespace, key, version)
+        if payload is not None:
+            try:
+                return loads(payload)
+            except Exception as e:
+                logger.warning(f"Discarding unreadable {namespace} cache entry: {str(e)}")
+
+        value = compute()
+        self.put(namespace, key, version, dumps(value))
+        return value
+
+    def invalidate(self, current_version: str) -> int:
+        """Drop every entry not computed from current_version; returns rows removed"""
+        with self._connect() as conn:
+            removed = conn.execute("DELETE FROM cache_entries WHERE version != ?", (current_version,)).rowcount
+        logger.info(f"Invalidated {removed} shared cache entries")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries GROUP BY namespace
+            """).fetchall()
+        return {namespace: {'entries': count, 'bytes': size} for namespace, count, size in rows}
@@ -0,0 +1,78 @@
+from typing import List, Dict, Any, Iterable, Tuple
+
+
+class SnapshotDiffer:
+    """Compare an incoming crawl against the stored domains snapshot"""
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    TRANSFERRED = 'transferred'
+    MEMBER_CHANGED = 'member_changed'
+
+    CHANGE_TYPES = [ADDED, REMOVED, TRANSFERRED, MEMBER_CHANGED]
+
+    @staticmethod
+    def build_state(rows: Iterable[Tuple[str, str, int]]) -> Dict[str, Tuple[str, int]]:
+        """Build the name -> (owner, member_count) hash table for the stored side"""
+        return {name: (owner, member_count) for name, owner, member_count in rows}
+
+    @staticmethod
+    def diff(previous: Dict[str, Tuple[str, int]],
+             incoming: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Hash-join incoming records against the previous state in one pass.
+
+        A name whose owner and member count both changed produces two rows,
+        one 'transferred' and one 'member_changed'.
+        """
+        remaining = dict(previous)
+        changes = []
+
+        for record in incoming:
+            name = record['name']
+            new_owner = record.get('owner')
+            new_members = record.get('member_count')
+            old = remaining.pop(name, None)
+
+            if old is None:
+                changes.append({
+                    'name': name,
+                    'change_type': SnapshotDiffer.ADDED,
+                    'old_owner': None,
+                    'new_owner': new_owner,
+                    'old_member_count': None,
+                    'new_member_count': new_members
+                })
+                continue
+
+            old_owner, old_members = old
+            if old_owner != new_owner:
+                changes.append({
+                    'name': name,
+                    'change_type': SnapshotDiffer.TRANSFERRED,
+                    'old_owner': old_owner,
+                    'new_owner': new_owner,
+                    'old_member_count': old_members,
+                    'new_member_count': new_members
+                })
+            if old_members != new_members:
+                changes.append({
+                    'name': name,
+                    'change_type': SnapshotDiffer.MEMBER_CHANGED,
+                    'old_owner': old_owner,
+                    'new_owner': new_owner,
+                    'old_member_count': old_members,
+                    'new_member_count': new_members
+                })
+
+        # Anything left in the stored side was not seen in this crawl
+        for name, (old_owner, old_members) in remaining.items():
+            changes.append({
+                'name': name,
+                'change_type': SnapshotDiffer.REMOVED,
+                'old_owner': old_owner,
+                'new_owner': None,
+                'old_member_count': old_members,
+                'new_member_count': None
+            })
+
+        return changes
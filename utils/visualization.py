@@ -3,9 +3,11 @@ import math
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from utils.profiling import profiled
 
 class Visualizer:
     @staticmethod
+    @profiled('Visualizer.create_network_graph')
     def create_network_graph(df, min_members=1):
         """Create interactive 3D network visualization with domain connections"""
 
@@ -159,6 +161,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @profiled('Visualizer.create_member_growth_chart')
     def create_member_growth_chart(df, selected_domains=None):
         """Create time series visualization of member growth using mint dates"""
         fig = go.Figure()
@@ -242,4 +245,47 @@ class Visualizer:
             )
         )
 
-        return fig
\ No newline at end of file
+        return fig
+
+    @staticmethod
+    @profiled('Visualizer.create_world_overlap_heatmap')
+    def create_world_overlap_heatmap(sketches, metric='overlap'):
+        """Heatmap of estimated shared members (or Jaccard similarity) between worlds"""
+        if len(sketches) == 0:
+            return go.Figure()
+
+        if metric == 'jaccard':
+            values = sketches.jaccard_matrix()
+            hover_value = "Similarity: %{z:.2f}"
+            colorbar_title = "Jaccard"
+        else:
+            values = sketches.overlap_matrix()
+            hover_value = "Shared members: ~%{z:,.0f}"
+            colorbar_title = "Shared"
+
+        labels = [f"0://{world}" for world in sketches.worlds]
+        fig = go.Figure(go.Heatmap(
+            z=values,
+            x=labels,
+            y=labels,
+            colorscale='Viridis',
+            colorbar=dict(title=colorbar_title),
+            hovertemplate=(
+                "%{y} / %{x}<br>"
+                f"{hover_value}"
+                "<extra></extra>"
+            )
+        ))
+
+        fig.update_layout(
+            title="Estimated Member Overlap Between Worlds",
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            xaxis=dict(showticklabels=len(labels) <= 60, tickangle=45),
+            yaxis=dict(showticklabels=len(labels) <= 60, autorange='reversed'),
+            margin=dict(t=50, b=0, l=0, r=0),
+            height=800
+        )
+
+        return fig
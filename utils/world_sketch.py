@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+from typing import List, Tuple
+from utils.data_processor import stable_hash
+
+# Signature length: Jaccard estimates have a standard error of about 1/sqrt(K)
+NUM_PERMUTATIONS = 128
+_SEED = 0x5A4E53
+
+_rng = np.random.default_rng(_SEED)
+# Multiply-shift hash family: (a * x + b) >> 32 with odd a
+_MULTIPLIERS = _rng.integers(1, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_OFFSETS = _rng.integers(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64)
+_CHUNK = 16
+
+
+class WorldSketches:
+    """MinHash signatures of the owner set of every world.
+
+    A world's members are the distinct addresses owning any name in it.
+    Each signature is NUM_PERMUTATIONS uint32 minima (512 bytes), so shared
+    members between any two worlds can be estimated without their sets:
+    the fraction of equal positions estimates the Jaccard index J, and
+    |A & B| is about J / (1 + J) * (|A| + |B|).
+    """
+
+    def __init__(self, worlds: List[str], member_counts: np.ndarray, signatures: np.ndarray):
+        self.worlds = list(worlds)
+        self.member_counts = np.asarray(member_counts, dtype=np.int64)
+        self.signatures = np.asarray(signatures, dtype=np.uint32).reshape(len(self.worlds), NUM_PERMUTATIONS)
+
+    def __len__(self) -> int:
+        return len(self.worlds)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'WorldSketches':
+        """Build signatures for every world in a domains DataFrame in one pass"""
+        empty = cls([], np.empty(0), np.empty((0, NUM_PERMUTATIONS)))
+        if df.empty:
+            return empty
+
+        owned = df[df['owner'].notna() & (df['owner'] != 'Unknown') & df['world'].notna()]
+        pairs = pd.DataFrame({'world': owned['world'].to_numpy(dtype=object),
+                              'owner': owned['owner'].str.lower().to_numpy(dtype=object)}).drop_duplicates()
+        if pairs.empty:
+            return empty
+
+        world_codes, worlds = pd.factorize(pairs['world'], sort=True)
+        order = np.argsort(world_codes, kind='stable')
+        world_codes = world_codes[order]
+        owner_hashes = stable_hash(pairs['owner'].to_numpy()[order].tolist())
+
+        starts = np.flatnonzero(np.diff(world_codes, prepend=-1))
+        signatures = np.empty((len(worlds), NUM_PERMUTATIONS), dtype=np.uint32)
+        for chunk in range(0, NUM_PERMUTATIONS, _CHUNK):
+            a = _MULTIPLIERS[chunk:chunk + _CHUNK]
+            b = _OFFSETS[chunk:chunk + _CHUNK]
+            permuted = ((owner_hashes[:, None] * a[None, :] + b[None, :]) >> np.uint64(32)).astype(np.uint32)
+            signatures[:, chunk:chunk + _CHUNK] = np.minimum.reduceat(permuted, starts, axis=0)
+
+        member_counts = np.diff(np.append(starts, len(world_codes)))
+        return cls(list(worlds), member_counts, signatures)
+
+    def to_rows(self) -> List[Tuple[str, int, bytes]]:
+        """(world, member_count, signature bytes) rows for storage"""
+        return [(world, int(count), signature.tobytes())
+                for world, count, signature in zip(self.worlds, self.member_counts, self.signatures)]
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[str, int, bytes]]) -> 'WorldSketches':
+        """Rebuild from stored rows; a world appearing twice is merged as a set union"""
+        merged = {}
+        for world, count, blob in rows:
+            signature = np.frombuffer(blob, dtype=np.uint32)
+            if world in merged:
+                previous_count, previous = merged[world]
+                union = np.minimum(previous, signature)
+                jaccard = np.mean(previous == signature)
+                # |A | B| = (|A| + |B|) / (1 + J)
+                merged[world] = (int(round((previous_count + count) / (1 + jaccard))), union)
+            else:
+                merged[world] = (count, signature)
+
+        worlds = list(merged)
+        if not worlds:
+            return cls([], np.empty(0), np.empty((0, NUM_PERMUTATIONS)))
+        return cls(worlds,
+                   np.array([merged[world][0] for world in worlds]),
+                   np.stack([merged[world][1] for world in worlds]))
+
+    def top(self, n: int) -> 'WorldSketches':
+        """The n worlds with the most members"""
+        order = np.argsort(-self.member_counts, kind='stable')[:n]
+        return WorldSketches([self.worlds[i] for i in order], self.member_counts[order], self.signatures[order])
+
+    def jaccard_matrix(self) -> np.ndarray:
+        """Estimated Jaccard index for every pair of worlds"""
+        n = len(self.worlds)
+        matches = np.zeros((n, n), dtype=np.int32)
+        # One permutation at a time keeps memory at n x n
+        for column in self.signatures.T:
+            matches += column[:, None] == column[None, :]
+        return matches / NUM_PERMUTATIONS
+
+    def overlap_matrix(self) -> np.ndarray:
+        """Estimated number of shared members for every pair of worlds"""
+        jaccard = self.jaccard_matrix()
+        totals = self.member_counts[:, None] + self.member_counts[None, :]
+        overlap = np.rint(jaccard / (1 + jaccard) * totals)
+        np.fill_diagonal(overlap, self.member_counts)
+        return overlap